@@ -0,0 +1,57 @@
+"""
+Shared asyncio event loop for the skills' async work.
+
+One background thread hosts a single event loop for the whole process.
+Any thread can hand it a coroutine with submit() and get back a
+concurrent.futures.Future, so concurrent callers share one loop instead
+of each starting their own.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoopThread:
+    """Runs an asyncio event loop forever in a daemon thread."""
+
+    def __init__(self, name: str = "ZoyaAsyncLoop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the loop; safe to call from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and self.loop.is_running()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the loop and wait for the thread to exit."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+
+# Singleton loop thread for global access
+_loop_thread: Optional[AsyncLoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_loop_thread() -> AsyncLoopThread:
+    """Get the process-wide loop thread, starting it on first use."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None or not _loop_thread.is_running():
+            _loop_thread = AsyncLoopThread()
+        return _loop_thread
+
@@ -1,8 +1,8 @@
 import os
 import re
 from datetime import datetime
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from skills.observer_pool import detach, get_observer
 
 
 class ExecutionEngine:
@@ -154,21 +154,21 @@ class ExecutionMonitor:
         self.approved_path = approved_path
         self.done_path = done_path
         self.execution_engine = ExecutionEngine(approved_path, done_path)
-        self.observer = Observer()
+        self.observer = get_observer()
+        self.watch = None
         self.handler = ExecutionHandler(self.execution_engine)
 
     def start_monitoring(self):
         """
         Start monitoring the Approved folder for new plan files.
         """
-        self.observer.schedule(self.handler, self.approved_path, recursive=False)
-        self.observer.start()
+        self.watch = self.observer.schedule(self.handler, self.approved_path, recursive=False)
         print(f"Started monitoring {self.approved_path} for plan execution...")
 
     def stop_monitoring(self):
         """
         Stop monitoring the Approved folder.
         """
-        self.observer.stop()
-        self.observer.join()
+        detach(self.watch, self.handler)
+        self.watch = None
         print("Stopped execution monitor.")
\ No newline at end of file
@@ -1,7 +1,7 @@
 import os
 from datetime import datetime
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from skills.observer_pool import detach, get_observer
 from skills.base_watcher import BaseWatcher
 
 
@@ -14,21 +14,21 @@ class FilesystemWatcher(BaseWatcher):
     def __init__(self, monitored_path: str, output_path: str):
         super().__init__(monitored_path)
         self.output_path = output_path
-        self.observer = Observer()
+        self.observer = get_observer()
+        self.watch = None
         self.event_handler = FileCreatedHandler(self)
         
     def start_monitoring(self):
         """Start the filesystem monitoring process"""
         self.ensure_directory_exists(self.output_path)
-        self.observer.schedule(self.event_handler, self.monitored_path, recursive=False)
-        self.observer.start()
+        self.watch = self.observer.schedule(self.event_handler, self.monitored_path, recursive=False)
         self.is_running = True
         print(f"Started monitoring {self.monitored_path}")
         
     def stop_monitoring(self):
         """Stop the filesystem monitoring process"""
-        self.observer.stop()
-        self.observer.join()
+        detach(self.watch, self.event_handler)
+        self.watch = None
         self.is_running = False
         print("Stopped monitoring")
         
@@ -1,4 +1,4 @@
-import time
+import asyncio
 import psutil
 import subprocess
 from datetime import datetime
@@ -16,6 +16,8 @@ class HealthMonitor:
         self.log_path = log_path
         self.running = False
         self.check_interval = 300  # 5 minutes in seconds
+        self._loop = None
+        self._stop_event = None  # asyncio.Event, created on the loop that runs run_async
         self.services_to_monitor = [
             "filesystem_watcher",
             "gmail_watcher",
@@ -117,25 +119,36 @@ class HealthMonitor:
         
         return report
     
-    def start_monitoring(self):
-        """Start the health monitoring loop"""
+    async def run_async(self):
+        """Run the health monitoring loop as a coroutine on the caller's event loop"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
         self.running = True
         self.log_message("Health Monitor started")
         
         while self.running:
             try:
-                self.log_health_check()
-                time.sleep(self.check_interval)
-            except KeyboardInterrupt:
-                self.log_message("Health Monitor stopped by user")
-                break
+                # psutil calls block (cpu_percent samples for a second), so keep them off the loop
+                await self._loop.run_in_executor(None, self.log_health_check)
             except Exception as e:
                 self.log_message(f"Error in health monitor: {str(e)}")
-                time.sleep(self.check_interval)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), self.check_interval)
+            except asyncio.TimeoutError:
+                continue
+    
+    def start_monitoring(self):
+        """Start the health monitoring loop (blocks until stopped)"""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            self.log_message("Health Monitor stopped by user")
     
     def stop_monitoring(self):
         """Stop the health monitoring"""
         self.running = False
+        if self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         self.log_message("Health Monitor stopped")
     
     def run_once(self):
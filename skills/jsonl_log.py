@@ -0,0 +1,177 @@
+"""
+Append-only JSONL logs shared by the skills.
+
+Entries are written one JSON object per line. BufferedJSONLWriter moves
+the disk writes off the caller's thread and batches them, trimming the
+file back to its last `keep` lines every `keep` entries so retention
+costs one rewrite per `keep` writes. read_jsonl_tail() reads only the
+end of a log. json_bytes() and json_loads() are the skills' shared JSON
+codec, backed by orjson when it is installed.
+"""
+
+import os
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; it serializes straight to bytes and is several times
+# faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Block size used when reading a JSONL log backwards from its end
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def read_jsonl_tail(path: Path, limit: int) -> List[Dict]:
+    """
+    Return the last `limit` entries of a JSONL file, skipping bad lines.
+
+    The file is read backwards from its end in blocks until `limit` lines
+    are in hand, so the cost follows `limit` rather than the file size.
+    """
+    if limit <= 0:
+        return []
+
+    try:
+        with open(path, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            while pos > 0 and data.count(b"\n") <= limit:
+                step = min(TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+    except OSError:
+        return []
+
+    lines = data.splitlines()
+    if pos > 0:
+        # Stopped mid-file: the first line is a partial record
+        lines = lines[1:]
+    lines = lines[-limit:]
+
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json_loads(line))
+        except ValueError:
+            continue
+    return entries
+
+
+def trim_jsonl(path: Path, keep: int):
+    """Rewrite a JSONL log keeping only its last `keep` lines."""
+    try:
+        with open(path, 'rb') as f:
+            tail = deque(f, maxlen=keep)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.writelines(tail)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not trim {path}: {e}")
+
+
+class BufferedJSONLWriter:
+    """
+    Appends JSONL entries from a background thread.
+
+    put() only enqueues, so callers never wait on disk I/O. The writer
+    thread collects up to BATCH_SIZE entries (or whatever arrives within
+    FLUSH_INTERVAL seconds) and appends them with a single write, trimming
+    the file to its last `keep` lines once every `keep` entries.
+    """
+
+    BATCH_SIZE = 50
+    FLUSH_INTERVAL = 0.1
+
+    def __init__(self, path: Path, keep: int):
+        self.path = path
+        self.keep = keep
+        self._queue: "queue.Queue[Dict]" = queue.Queue()
+        self._writes_since_trim = 0
+        self._thread = threading.Thread(
+            target=self._flush_loop, name=f"JSONLWriter-{path.name}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def put(self, entry: Dict):
+        """Queue an entry for writing."""
+        self._queue.put(entry)
+
+    def flush(self):
+        """Block until every queued entry has been written."""
+        self._queue.join()
+
+    def _flush_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} entries to {self.path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: List[Dict]):
+        with open(self.path, 'ab') as f:
+            f.write(b"".join(json_bytes(entry) + b"\n" for entry in batch))
+
+        self._writes_since_trim += len(batch)
+        if self._writes_since_trim >= self.keep:
+            trim_jsonl(self.path, self.keep)
+            self._writes_since_trim = 0
+
+
+# One writer (and thread) per log file, shared by every caller
+_jsonl_writers: Dict[Path, BufferedJSONLWriter] = {}
+_jsonl_writers_lock = threading.Lock()
+
+
+def get_jsonl_writer(path: Path, keep: int) -> BufferedJSONLWriter:
+    """Get the shared buffered writer for a JSONL log file."""
+    with _jsonl_writers_lock:
+        writer = _jsonl_writers.get(path)
+        if writer is None:
+            writer = BufferedJSONLWriter(path, keep)
+            _jsonl_writers[path] = writer
+        return writer
@@ -27,7 +27,7 @@ def load_env_file():
             with open(env_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
+                    if line and line[0] != '#' and '=' in line:
                         key, value = line.split('=', 1)
                         os.environ.setdefault(key.strip(), value.strip())
         except Exception:
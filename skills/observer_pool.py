@@ -0,0 +1,65 @@
+"""
+Shared watchdog Observer for the folder monitors.
+
+Every monitor schedules its handler on one process-wide Observer instead
+of starting its own, so running several monitors costs one emitter
+thread set and one inotify/kqueue instance rather than one per monitor.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
+
+# Singleton observer for global access
+_observer: Optional[Observer] = None
+_observer_lock = threading.Lock()
+
+
+def get_observer() -> Observer:
+    """Get the shared Observer, starting it on first use."""
+    global _observer
+    with _observer_lock:
+        # A stopped Observer thread cannot be restarted, so replace it
+        if _observer is None or not _observer.is_alive():
+            _observer = Observer()
+            _observer.daemon = True
+            _observer.start()
+        return _observer
+
+
+def detach(watch: Optional[ObservedWatch], handler: FileSystemEventHandler):
+    """
+    Remove one monitor's handler from the shared Observer.
+
+    Watches on the same path compare equal, so unschedule() would drop
+    every monitor's handler on that path; only `handler` is removed here.
+    A None watch (monitor never started) is ignored, as is a watch that
+    belonged to an Observer since stopped or replaced.
+    """
+    if watch is None:
+        return
+    with _observer_lock:
+        observer = _observer
+    if observer is None:
+        return
+    try:
+        observer.remove_handler_for_watch(handler, watch)
+    except KeyError:
+        pass
+
+
+def stop_observer(timeout: float = 5.0):
+    """Stop the shared Observer and wait for it to exit."""
+    global _observer
+    with _observer_lock:
+        observer, _observer = _observer, None
+    if observer is not None and observer.is_alive():
+        observer.stop()
+        observer.join(timeout)
+
+
+atexit.register(stop_observer)
@@ -1,13 +1,38 @@
 import os
 import time
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
+
+from watchdog.events import FileSystemEventHandler
+from skills.observer_pool import detach, get_observer
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+class PersistenceStatus(NamedTuple):
+    """Snapshot of the pipeline returned by PersistenceLoop.get_status()."""
+    running: bool
+    plans_pending: int
+    approved_pending: int
+    odoo_pending: int
+    total_pending: int
+    check_interval: int
+
+
+class _WakeOnChange(FileSystemEventHandler):
+    """Wakes the persistence loop whenever a monitored folder changes."""
+
+    def __init__(self, wake: threading.Event):
+        self.wake = wake
+
+    def on_any_event(self, event):
+        self.wake.set()
+
+
 class PersistenceLoop:
     """
     Implements the Ralph Wiggum Loop - prevents terminal exit until all tasks
@@ -21,6 +46,8 @@ class PersistenceLoop:
     The loop ensures the agent stays alive while work is pending.
     """
 
+    DEBOUNCE_SECONDS = 0.2
+
     def __init__(
         self,
         plans_path: str = "obsidian_vault/Plans",
@@ -36,6 +63,7 @@ class PersistenceLoop:
         self.check_interval = check_interval
         self.active_tasks = set()
         self._stop_requested = False
+        self._wake = threading.Event()
 
         # Ensure directories exist
         for path in [self.plans_path, self.approved_path, self.pending_odoo_path, self.done_path]:
@@ -93,9 +121,23 @@ class PersistenceLoop:
 
         logger.info("Ralph Wiggum Loop activated")
 
-        iteration = 0
+        # Re-scan as soon as a monitored folder changes; check_interval is only a fallback
+        observer = get_observer()
+        handler = _WakeOnChange(self._wake)
+        watches = [observer.schedule(handler, str(path), recursive=False)
+                   for path in (self.plans_path, self.approved_path, self.pending_odoo_path)]
+        try:
+            return self._run_loop(continuous)
+        finally:
+            for watch in watches:
+                detach(watch, handler)
+
+    def _run_loop(self, continuous: bool) -> bool:
+        standby_interval = 60  # Log "standing by" at most once a minute
+        next_standby = time.monotonic() + standby_interval
         while not self._stop_requested:
-            iteration += 1
+            # Clear before scanning so changes made during the scan wake the next wait
+            self._wake.clear()
             work = self.get_all_pending_work()
             timestamp = datetime.now().strftime('%H:%M:%S')
 
@@ -103,7 +145,8 @@ class PersistenceLoop:
 
             if total_pending == 0:
                 if continuous:
-                    if iteration % 12 == 0:  # Log every minute (12 * 5 seconds)
+                    if time.monotonic() >= next_standby:
+                        next_standby = time.monotonic() + standby_interval
                         print(f"[{timestamp}] No pending work - standing by...")
                         logger.debug("No pending work - standing by")
                 else:
@@ -142,27 +185,33 @@ class PersistenceLoop:
                 print("-" * 40)
                 print(f"  TOTAL PENDING: {total_pending}")
 
-            # Wait before next check
-            time.sleep(self.check_interval)
+            # Wait for a folder change, stop(), or the fallback interval
+            if self._wake.wait(self.check_interval):
+                # Let the burst of events from one save settle before re-scanning
+                self._wake.clear()
+                while not self._stop_requested and self._wake.wait(self.DEBOUNCE_SECONDS):
+                    self._wake.clear()
 
         return True
 
     def stop(self):
         """Request the loop to stop."""
         self._stop_requested = True
+        self._wake.set()
         logger.info("Ralph Wiggum Loop: Stop requested")
 
-    def get_status(self) -> dict:
+    def get_status(self) -> PersistenceStatus:
         """Get current loop status."""
         work = self.get_all_pending_work()
-        return {
-            'running': not self._stop_requested,
-            'plans_pending': len(work['plans']),
-            'approved_pending': len(work['approved']),
-            'odoo_pending': len(work['pending_odoo']),
-            'total_pending': len(work['plans']) + len(work['approved']) + len(work['pending_odoo']),
-            'check_interval': self.check_interval
-        }
+        plans, approved, odoo = len(work['plans']), len(work['approved']), len(work['pending_odoo'])
+        return PersistenceStatus(
+            running=not self._stop_requested,
+            plans_pending=plans,
+            approved_pending=approved,
+            odoo_pending=odoo,
+            total_pending=plans + approved + odoo,
+            check_interval=self.check_interval
+        )
 
 
 def main():
@@ -11,11 +11,15 @@
 """
 
 import os
-import json
+import asyncio
 import logging
+import threading
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Callable
+
+from skills.jsonl_log import get_jsonl_writer, json_bytes, read_jsonl_tail, trim_jsonl
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -31,20 +35,45 @@ except ImportError:
     def get_mcp_client(): return None
 
 
+# mtime of the .env file last parsed by load_env()
+_ENV_MTIME: Optional[int] = None
+
+
 def load_env():
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file (skipped if unchanged)."""
+    global _ENV_MTIME
     env_path = Path('.env')
-    if env_path.exists():
-        with open(env_path, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    k, v = line.split('=', 1)
-                    os.environ.setdefault(k.strip(), v.strip())
+    try:
+        mtime = env_path.stat().st_mtime_ns
+    except OSError:
+        return
+    if mtime == _ENV_MTIME:
+        return
+
+    for line in env_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if line and line[0] != '#' and '=' in line:
+            k, v = line.split('=', 1)
+            os.environ.setdefault(k.strip(), v.strip())
+    _ENV_MTIME = mtime
 
 load_env()
 
 
+# File-based fallback payloads are written here when MCP is offline
+FALLBACK_DIR = Path("workspace/mcp_fallback/social")
+
+# Timestamp shared by every post of the broadcast in progress. A ContextVar
+# rather than an attribute so concurrent broadcasts on the shared manager
+# don't see each other's value; asyncio.to_thread carries it into workers.
+_broadcast_ts: ContextVar[Optional[str]] = ContextVar("broadcast_ts", default=None)
+
+
+def _event_timestamp() -> str:
+    """ISO timestamp of the current broadcast, or of now outside one."""
+    return _broadcast_ts.get() or datetime.now().isoformat()
+
+
 class SocialMediaManager:
     """
     MCP-Powered Social Media Manager for Zoya AI.
@@ -58,6 +87,9 @@ class SocialMediaManager:
     Uses MCP Servers when available, falls back to file-based mode.
     """
 
+    # Upper bound on platforms posted to at once during a broadcast
+    MAX_CONCURRENT_POSTS = 8
+
     # Platform configurations
     PLATFORMS = {
         "linkedin": {
@@ -94,35 +126,68 @@ class SocialMediaManager:
         }
     }
 
+    # Platform-specific payload options callers may override via kwargs
+    PLATFORM_OPTIONS = {
+        "linkedin": {"visibility": "PUBLIC"},
+        "twitter": {"reply_settings": "everyone"},
+        "instagram": {"media_type": "TEXT"},
+        "facebook": {"privacy": "EVERYONE"}
+    }
+
+    # Static payload fields per platform, built once at class load;
+    # content/timestamp are filled per post by _build_payload
+    _PAYLOAD_TEMPLATES = {
+        platform: {
+            "platform": platform,
+            "platform_name": config["name"],
+            "content": None,
+            "timestamp": None,
+            "source": "Zoya_AI_Employee",
+            "mcp_tool": config["mcp_tool"],
+            "api_endpoint": config["api_endpoint"]
+        }
+        for platform, config in PLATFORMS.items()
+    }
+    _PAYLOAD_TEMPLATES["linkedin"]["author"] = "urn:li:person:USER_ID"
+
+    # Character limit per platform, flattened for _truncate_content
+    _MAX_CHARS = {platform: config["max_chars"] for platform, config in PLATFORMS.items()}
+
     def __init__(self):
+        # The MCP client is blocking; broadcast_to_all_async already runs each
+        # post_to_platform call in a worker thread
         self.mcp_client = get_mcp_client() if MCP_AVAILABLE else None
-        self.audit_log_path = Path("logs/audit_log.json")
-        self.execution_log_path = Path("logs/social_execution.json")
+        self.audit_log_path = Path("logs/audit_log.jsonl")
+        self.execution_log_path = Path("logs/social_execution.jsonl")
+
+        # Appends since the last retention trim, per log file
+        self._writes_since_trim: Dict[Path, int] = {}
+        # Broadcasts post from worker threads; serialize log appends/trims
+        self._log_lock = threading.Lock()
 
         # Check MCP status for social server
         self.mcp_active = is_mcp_active("social") if MCP_AVAILABLE else False
 
         # Initialize execution log
         self.execution_log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Execution entries are written off the post's critical path
+        self._execution_writer = get_jsonl_writer(self.execution_log_path, keep=50)
+
+        # Created once here rather than on every file-based post
+        FALLBACK_DIR.mkdir(parents=True, exist_ok=True)
 
         self._log_init()
 
     def _log_init(self):
         """Log initialization status."""
         mode = "MCP Active" if self.mcp_active else "File-Based Mode"
-        print(f"\n[ZOYA SOCIAL] Social Media Manager initialized")
-        print(f"[ZOYA SOCIAL] Mode: {mode}")
-        print(f"[ZOYA SOCIAL] Platforms: LinkedIn, Twitter(X), Instagram, Facebook")
+        logger.info("[ZOYA SOCIAL] Social Media Manager initialized | Mode: %s | "
+                    "Platforms: LinkedIn, Twitter(X), Instagram, Facebook", mode)
         mcp_terminal_log("SOCIAL_INIT", f"Mode={mode} | Platforms=4")
 
-    def get_platform_status(self, platform: str) -> Dict[str, Any]:
-        """Get MCP status for a specific platform."""
-        if platform not in self.PLATFORMS:
-            return {"active": False, "error": "Unknown platform"}
-
+    def _platform_status(self, platform: str, mcp_active: bool) -> Dict[str, Any]:
+        """Build the status entry for a known platform."""
         config = self.PLATFORMS[platform]
-        mcp_active = is_mcp_active(config["mcp_server"]) if MCP_AVAILABLE else False
-
         return {
             "platform": platform,
             "name": config["name"],
@@ -133,74 +198,79 @@ class SocialMediaManager:
             "status": "🟢 MCP Active" if mcp_active else "🔴 MCP Offline"
         }
 
+    def get_platform_status(self, platform: str) -> Dict[str, Any]:
+        """Get MCP status for a specific platform."""
+        if platform not in self.PLATFORMS:
+            return {"active": False, "error": "Unknown platform"}
+
+        server = self.PLATFORMS[platform]["mcp_server"]
+        mcp_active = is_mcp_active(server) if MCP_AVAILABLE else False
+        return self._platform_status(platform, mcp_active)
+
     def get_all_platform_status(self) -> Dict[str, Dict]:
         """Get MCP status for all platforms."""
-        return {p: self.get_platform_status(p) for p in self.PLATFORMS}
+        # Platforms share MCP servers (all use "social" today); ask each server once
+        servers = {config["mcp_server"] for config in self.PLATFORMS.values()}
+        active = {server: is_mcp_active(server) if MCP_AVAILABLE else False for server in servers}
+        return {
+            p: self._platform_status(p, active[config["mcp_server"]])
+            for p, config in self.PLATFORMS.items()
+        }
 
     def _truncate_content(self, content: str, platform: str) -> str:
         """Truncate content to platform's max character limit."""
-        max_chars = self.PLATFORMS[platform]["max_chars"]
-        if len(content) <= max_chars:
-            return content
-        return content[:max_chars-3] + "..."
+        max_chars = self._MAX_CHARS[platform]
+        return content if len(content) <= max_chars else content[:max_chars-3] + "..."
 
     def _build_payload(self, platform: str, content: str, **kwargs) -> Dict:
         """Build API payload for a platform."""
-        config = self.PLATFORMS[platform]
-        timestamp = datetime.now().isoformat()
+        payload = self._PAYLOAD_TEMPLATES[platform].copy()
+        payload["content"] = self._truncate_content(content, platform)
+        payload["timestamp"] = _event_timestamp()
 
-        base_payload = {
-            "platform": platform,
-            "platform_name": config["name"],
-            "content": self._truncate_content(content, platform),
-            "timestamp": timestamp,
-            "source": "Zoya_AI_Employee",
-            "mcp_tool": config["mcp_tool"],
-            "api_endpoint": config["api_endpoint"]
-        }
+        for key, default in self.PLATFORM_OPTIONS[platform].items():
+            payload[key] = kwargs.get(key, default)
+        if platform == "instagram":
+            payload["caption"] = payload["content"]
 
-        # Platform-specific fields
-        if platform == "linkedin":
-            base_payload["visibility"] = kwargs.get("visibility", "PUBLIC")
-            base_payload["author"] = "urn:li:person:USER_ID"
-        elif platform == "twitter":
-            base_payload["reply_settings"] = kwargs.get("reply_settings", "everyone")
-        elif platform == "instagram":
-            base_payload["media_type"] = kwargs.get("media_type", "TEXT")
-            base_payload["caption"] = base_payload["content"]
-        elif platform == "facebook":
-            base_payload["privacy"] = kwargs.get("privacy", "EVERYONE")
+        return payload
 
-        return base_payload
+    def _append_log(self, path: Path, entry: Dict, keep: int):
+        """
+        Append one entry to a JSONL log.
+
+        Every `keep` appends the file is trimmed back to its last `keep`
+        lines, so retention costs one rewrite per `keep` writes instead of
+        one per write.
+        """
+        line = json_bytes(entry) + b"\n"
+
+        with self._log_lock:
+            with open(path, 'ab') as f:
+                f.write(line)
+
+            writes = self._writes_since_trim.get(path, 0) + 1
+            if writes >= keep:
+                trim_jsonl(path, keep)
+                writes = 0
+            self._writes_since_trim[path] = writes
 
     def _log_to_audit(self, action: str, status: str, details: Dict):
         """Log action to audit trail."""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _event_timestamp(),
             "action_type": action,
             "actor": "Zoya_AI_Social",
             "status": status,
             "details": details
         }
 
-        # Load existing logs
-        logs = []
-        if self.audit_log_path.exists():
-            try:
-                with open(self.audit_log_path, encoding='utf-8') as f:
-                    logs = json.load(f)
-            except:
-                logs = []
-
-        logs.append(entry)
-
-        with open(self.audit_log_path, 'w', encoding='utf-8') as f:
-            json.dump(logs[-100:], f, indent=2)
+        self._append_log(self.audit_log_path, entry, keep=100)
 
     def _log_execution(self, platform: str, status: str, result: Dict):
         """Log execution result for UI display."""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _event_timestamp(),
             "platform": platform,
             "platform_name": self.PLATFORMS[platform]["name"],
             "icon": self.PLATFORMS[platform]["icon"],
@@ -210,19 +280,7 @@ class SocialMediaManager:
             "message": f"Post published via MCP Tool: {self.PLATFORMS[platform]['name']}" if result.get("mcp_used") else f"Post queued (File-Based): {self.PLATFORMS[platform]['name']}"
         }
 
-        # Load existing execution log
-        logs = []
-        if self.execution_log_path.exists():
-            try:
-                with open(self.execution_log_path, encoding='utf-8') as f:
-                    logs = json.load(f)
-            except:
-                logs = []
-
-        logs.append(entry)
-
-        with open(self.execution_log_path, 'w', encoding='utf-8') as f:
-            json.dump(logs[-50:], f, indent=2)
+        self._execution_writer.put(entry)
 
         return entry
 
@@ -244,13 +302,11 @@ class SocialMediaManager:
         config = self.PLATFORMS[platform]
         payload = self._build_payload(platform, content, **kwargs)
 
-        print(f"\n{'='*60}")
-        print(f"[ZOYA SOCIAL] Publishing to {config['name']} {config['icon']}")
-        print(f"{'='*60}")
+        logger.info("[ZOYA SOCIAL] Publishing to %s %s", config['name'], config['icon'])
 
         # Try MCP first
         if self.mcp_active and self.mcp_client:
-            print(f"[ZOYA MCP] Calling MCP tool: {config['mcp_server']}.{config['mcp_tool']}")
+            logger.info("[ZOYA MCP] Calling MCP tool: %s.%s", config['mcp_server'], config['mcp_tool'])
             mcp_terminal_log("MCP_CALL", f"Calling MCP tool to post on {config['name']}...")
 
             try:
@@ -263,10 +319,8 @@ class SocialMediaManager:
                 if used_mcp:
                     post_id = mcp_result.get("post_id", f"{platform}_{int(datetime.now().timestamp())}")
 
-                    print(f"[ZOYA MCP] ✓ MCP Response: SUCCESS")
-                    print(f"[ZOYA MCP] Post ID: {post_id}")
-                    print(f"[ZOYA MCP] Post published via MCP Tool: {config['name']}")
-                    print(f"{'='*60}\n")
+                    logger.info("[ZOYA MCP] ✓ MCP Response: SUCCESS | Post ID: %s | "
+                                "Post published via MCP Tool: %s", post_id, config['name'])
 
                     mcp_terminal_log("MCP_SUCCESS", f"Post published via MCP Tool: {config['name']} | post_id={post_id}")
 
@@ -293,26 +347,27 @@ class SocialMediaManager:
                     }
             except Exception as e:
                 logger.error(f"MCP call failed: {e}")
-                print(f"[ZOYA MCP] MCP call failed, falling back to file-based mode")
+                logger.info("[ZOYA MCP] MCP call failed, falling back to file-based mode")
 
         # Fallback to file-based mode
-        print(f"[ZOYA SOCIAL] MCP Offline - Using file-based mode")
-        print(f"[ZOYA SOCIAL] Saving post to fallback file...")
+        logger.info("[ZOYA SOCIAL] MCP Offline - Using file-based mode")
         mcp_terminal_log("FILE_BASED", f"MCP offline - saving {config['name']} post to file")
 
         # Save to fallback file
-        fallback_dir = Path("workspace/mcp_fallback/social")
-        fallback_dir.mkdir(parents=True, exist_ok=True)
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fallback_file = fallback_dir / f"{platform}_{timestamp}.json"
+        fallback_file = FALLBACK_DIR / f"{platform}_{timestamp}.json"
 
-        with open(fallback_file, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, indent=2)
+        # Compact: fallback payloads are read back by code, not people
+        data = json_bytes(payload)
+        try:
+            fallback_file.write_bytes(data)
+        except FileNotFoundError:
+            # Directory removed since __init__; recreate and retry once
+            FALLBACK_DIR.mkdir(parents=True, exist_ok=True)
+            fallback_file.write_bytes(data)
 
-        print(f"[ZOYA SOCIAL] ✓ Saved to: {fallback_file}")
-        print(f"[ZOYA SOCIAL] Post queued (File-Based): {config['name']}")
-        print(f"{'='*60}\n")
+        logger.info("[ZOYA SOCIAL] ✓ Saved to: %s | Post queued (File-Based): %s",
+                    fallback_file, config['name'])
 
         # Log to audit
         self._log_to_audit(
@@ -336,9 +391,19 @@ class SocialMediaManager:
             "execution_log": exec_log
         }
 
-    def broadcast_to_all(self, content: str, platforms: List[str] = None, **kwargs) -> Dict[str, Any]:
+    async def _post_to_platform_async(self, platform: str, content: str,
+                                      semaphore: asyncio.Semaphore, **kwargs) -> Dict[str, Any]:
+        """Run post_to_platform in a worker thread, bounded by the semaphore."""
+        async with semaphore:
+            return await asyncio.to_thread(self.post_to_platform, platform, content, **kwargs)
+
+    async def broadcast_to_all_async(self, content: str, platforms: List[str] = None, **kwargs) -> Dict[str, Any]:
         """
-        Broadcast content to multiple platforms via MCP.
+        Broadcast content to multiple platforms concurrently.
+
+        All platform posts are started together, so a broadcast takes as
+        long as the slowest platform rather than the sum of all of them.
+        Use this directly from code that already runs an event loop.
 
         Args:
             content: Post content
@@ -351,30 +416,63 @@ class SocialMediaManager:
         if platforms is None:
             platforms = list(self.PLATFORMS.keys())
 
-        print(f"\n{'='*60}")
-        print(f"[ZOYA SOCIAL] 📡 BROADCASTING TO {len(platforms)} PLATFORMS")
-        print(f"{'='*60}")
+        logger.info("[ZOYA SOCIAL] 📡 BROADCASTING TO %d PLATFORMS", len(platforms))
         mcp_terminal_log("BROADCAST_START", f"Broadcasting to {len(platforms)} platforms")
 
+        targets = [p for p in platforms if p in self.PLATFORMS]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_POSTS)
+        token = _broadcast_ts.set(datetime.now().isoformat())
+        try:
+            outcomes = await asyncio.gather(
+                *[self._post_to_platform_async(p, content, semaphore, **kwargs) for p in targets],
+                return_exceptions=True
+            )
+        finally:
+            _broadcast_ts.reset(token)
+
+        return self._summarize_broadcast(platforms, targets, outcomes)
+
+    def _broadcast_sequential(self, content: str, platforms: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Post to each platform in turn on the calling thread."""
+        if platforms is None:
+            platforms = list(self.PLATFORMS.keys())
+
+        logger.info("[ZOYA SOCIAL] 📡 BROADCASTING TO %d PLATFORMS", len(platforms))
+        mcp_terminal_log("BROADCAST_START", f"Broadcasting to {len(platforms)} platforms")
+
+        targets = [p for p in platforms if p in self.PLATFORMS]
+        outcomes = []
+        token = _broadcast_ts.set(datetime.now().isoformat())
+        try:
+            for platform in targets:
+                try:
+                    outcomes.append(self.post_to_platform(platform, content, **kwargs))
+                except Exception as e:
+                    outcomes.append(e)
+        finally:
+            _broadcast_ts.reset(token)
+
+        return self._summarize_broadcast(platforms, targets, outcomes)
+
+    def _summarize_broadcast(self, platforms: List[str], targets: List[str], outcomes: List[Any]) -> Dict[str, Any]:
+        """Collect per-platform outcomes (results or exceptions) into the broadcast result."""
         results = {}
         success_count = 0
         mcp_count = 0
 
-        for platform in platforms:
-            if platform in self.PLATFORMS:
-                result = self.post_to_platform(platform, content, **kwargs)
-                results[platform] = result
+        for platform, result in zip(targets, outcomes):
+            if isinstance(result, Exception):
+                logger.error(f"Broadcast to {platform} failed: {result}")
+                result = {"success": False, "mcp_used": False, "error": str(result)}
+            results[platform] = result
 
-                if result.get("success"):
-                    success_count += 1
-                if result.get("mcp_used"):
-                    mcp_count += 1
+            if result.get("success"):
+                success_count += 1
+            if result.get("mcp_used"):
+                mcp_count += 1
 
-        print(f"\n{'='*60}")
-        print(f"[ZOYA SOCIAL] 📊 BROADCAST COMPLETE")
-        print(f"[ZOYA SOCIAL] Success: {success_count}/{len(platforms)}")
-        print(f"[ZOYA SOCIAL] MCP Used: {mcp_count}/{len(platforms)}")
-        print(f"{'='*60}\n")
+        logger.info("[ZOYA SOCIAL] 📊 BROADCAST COMPLETE | Success: %d/%d | MCP Used: %d/%d",
+                    success_count, len(platforms), mcp_count, len(platforms))
 
         mcp_terminal_log("BROADCAST_COMPLETE", f"Success={success_count}/{len(platforms)} | MCP={mcp_count}/{len(platforms)}")
 
@@ -386,51 +484,87 @@ class SocialMediaManager:
             "platforms": results
         }
 
+    def broadcast_to_all(self, content: str, platforms: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Broadcast content to multiple platforms via MCP.
+
+        Synchronous wrapper around broadcast_to_all_async(). asyncio.run()
+        cannot be nested, so when called from a thread that is already
+        running an event loop the platforms are posted one at a time instead.
+
+        Args:
+            content: Post content
+            platforms: List of platforms (default: all)
+            **kwargs: Platform-specific options
+
+        Returns:
+            Dict with results for each platform
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.broadcast_to_all_async(content, platforms, **kwargs))
+        return self._broadcast_sequential(content, platforms, **kwargs)
+
     def get_execution_log(self, limit: int = 10) -> List[Dict]:
         """Get recent execution log entries for UI display."""
-        if not self.execution_log_path.exists():
-            return []
+        self._execution_writer.flush()
+        return read_jsonl_tail(self.execution_log_path, limit)
 
-        try:
-            with open(self.execution_log_path, encoding='utf-8') as f:
-                logs = json.load(f)
-            return logs[-limit:]
-        except:
-            return []
+
+# Singleton manager shared by the convenience functions below
+_manager: Optional[SocialMediaManager] = None
+
+
+def _get_manager() -> SocialMediaManager:
+    """Get the shared SocialMediaManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = SocialMediaManager()
+    return _manager
+
+
+# post_to_platform bound to the shared manager, set on first use
+_post: Optional[Callable[..., Dict]] = None
+
+
+def post(platform: str, content: str, **kwargs) -> Dict:
+    """Post to any platform via MCP using the shared manager."""
+    global _post
+    if _post is None:
+        _post = _get_manager().post_to_platform
+    return _post(platform, content, **kwargs)
 
 
 # Convenience functions for direct platform posting
 def post_to_linkedin(content: str, **kwargs) -> Dict:
     """Quick post to LinkedIn via MCP."""
-    manager = SocialMediaManager()
-    return manager.post_to_platform("linkedin", content, **kwargs)
+    return post("linkedin", content, **kwargs)
 
 
 def post_to_twitter(content: str, **kwargs) -> Dict:
     """Quick post to Twitter/X via MCP."""
-    manager = SocialMediaManager()
-    return manager.post_to_platform("twitter", content, **kwargs)
+    return post("twitter", content, **kwargs)
 
 
 def post_to_instagram(content: str, **kwargs) -> Dict:
     """Quick post to Instagram via MCP."""
-    manager = SocialMediaManager()
-    return manager.post_to_platform("instagram", content, **kwargs)
+    return post("instagram", content, **kwargs)
 
 
 def post_to_facebook(content: str, **kwargs) -> Dict:
     """Quick post to Facebook via MCP."""
-    manager = SocialMediaManager()
-    return manager.post_to_platform("facebook", content, **kwargs)
+    return post("facebook", content, **kwargs)
 
 
 def broadcast_post(content: str, platforms: List[str] = None) -> Dict:
     """Broadcast to multiple platforms via MCP."""
-    manager = SocialMediaManager()
-    return manager.broadcast_to_all(content, platforms)
+    return _get_manager().broadcast_to_all(content, platforms)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     print("\n" + "="*60)
     print("Social Media Manager - MCP Test")
     print("="*60)
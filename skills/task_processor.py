@@ -1,32 +1,119 @@
 import os
+import json
 import time
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+import shutil
+import threading
+from collections import OrderedDict
+from watchdog.events import PatternMatchingEventHandler
+from skills.observer_pool import detach, get_observer
 from datetime import datetime
 
 
+# Plan file is written as header + original task bytes + footer, so the
+# task content is streamed through instead of built into one string
+PLAN_HEADER_TEMPLATE = "# PLAN_{task_name}\n\n## Original Task Content:\n"
+PLAN_FOOTER_TEMPLATE = """
+
+## Task Analysis
+- [ ] Analyze the requirements
+- [ ] Identify resources needed
+- [ ] Determine potential challenges
+
+## Proposed Action
+- [ ] Define specific steps to complete the task
+- [ ] Assign responsibilities if needed
+- [ ] Set timeline for completion
+
+## Status
+- [ ] Pending
+- [ ] In Progress
+- [ ] Completed
+
+---
+*Generated on: {generated_at}*
+"""
+
+
 class TaskProcessor:
     """
     Processes tasks in the Needs_Action folder and creates plans in the Plans folder.
     """
     
-    def __init__(self, needs_action_path: str, plans_path: str):
+    # Most recently processed files remembered (in memory and in the ledger)
+    MAX_PROCESSED_FILES = 10_000
+
+    def __init__(self, needs_action_path: str, plans_path: str,
+                 ledger_path: str = "workspace/.processed_files.jsonl"):
         self.needs_action_path = needs_action_path
         self.plans_path = plans_path
-        self.processed_files = set()
+        self.ledger_path = ledger_path
+        # path -> mtime_ns of the version a plan was generated from, oldest first
+        self.processed_files = OrderedDict()
+        # Lines currently in the ledger file, so it can be compacted while running
+        self._ledger_lines = 0
         
         # Ensure directories exist
         os.makedirs(self.needs_action_path, exist_ok=True)
         os.makedirs(self.plans_path, exist_ok=True)
+        ledger_dir = os.path.dirname(self.ledger_path)
+        if ledger_dir:
+            os.makedirs(ledger_dir, exist_ok=True)
+
+        self._load_ledger()
+
+    def _load_ledger(self):
+        """Restore processed files from the append-only ledger."""
+        line_count = 0
+        try:
+            with open(self.ledger_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        record = json.loads(line)
+                        self._remember(record["path"], record["mtime_ns"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            return
+
+        self._ledger_lines = line_count
+        self._maybe_compact_ledger()
+
+    def _append_ledger(self, task_file_path: str, mtime_ns: int):
+        """Append one processed file to the ledger, compacting it when it grows too long."""
+        with open(self.ledger_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"path": task_file_path, "mtime_ns": mtime_ns}) + "\n")
+        self._ledger_lines += 1
+        self._maybe_compact_ledger()
+
+    def _maybe_compact_ledger(self):
+        """Rewrite the ledger from memory once it holds far more lines than entries kept."""
+        if self._ledger_lines <= 2 * self.MAX_PROCESSED_FILES:
+            return
+        tmp_path = self.ledger_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for path, mtime_ns in self.processed_files.items():
+                f.write(json.dumps({"path": path, "mtime_ns": mtime_ns}) + "\n")
+        os.replace(tmp_path, self.ledger_path)
+        self._ledger_lines = len(self.processed_files)
+
+    def _remember(self, task_file_path: str, mtime_ns: int):
+        """Record a processed file, evicting the oldest beyond the cap."""
+        self.processed_files[task_file_path] = mtime_ns
+        self.processed_files.move_to_end(task_file_path)
+        while len(self.processed_files) > self.MAX_PROCESSED_FILES:
+            self.processed_files.popitem(last=False)
     
     def process_task_file(self, task_file_path: str):
         """
         Process a task file from Needs_Action and create a plan in Plans.
+
+        A file is processed again only if it changed (new mtime) since its
+        plan was generated.
         """
-        if task_file_path in self.processed_files:
+        mtime_ns = os.stat(task_file_path).st_mtime_ns
+        if self.processed_files.get(task_file_path) == mtime_ns:
             return
-            
-        self.processed_files.add(task_file_path)
         
         # Extract task name from file path
         task_filename = os.path.basename(task_file_path)
@@ -36,38 +123,21 @@ class TaskProcessor:
         plan_filename = f"PLAN_{task_name}.md"
         plan_path = os.path.join(self.plans_path, plan_filename)
         
-        # Read the task content
-        with open(task_file_path, 'r', encoding='utf-8') as f:
-            task_content = f.read()
-        
-        # Create the plan content
-        plan_content = f"""# PLAN_{task_name}
-
-## Original Task Content:
-{task_content}
-
-## Task Analysis
-- [ ] Analyze the requirements
-- [ ] Identify resources needed
-- [ ] Determine potential challenges
-
-## Proposed Action
-- [ ] Define specific steps to complete the task
-- [ ] Assign responsibilities if needed
-- [ ] Set timeline for completion
+        header = PLAN_HEADER_TEMPLATE.format_map({"task_name": task_name})
+        footer = PLAN_FOOTER_TEMPLATE.format_map({
+            "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
 
-## Status
-- [ ] Pending
-- [ ] In Progress
-- [ ] Completed
+        # Write the plan file, copying the task content in chunks
+        with open(task_file_path, 'rb') as task_file, open(plan_path, 'wb') as plan_file:
+            plan_file.write(header.encode('utf-8'))
+            shutil.copyfileobj(task_file, plan_file, 65536)
+            plan_file.write(footer.encode('utf-8'))
 
----
-*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
-"""
-        
-        # Write the plan file
-        with open(plan_path, 'w', encoding='utf-8') as f:
-            f.write(plan_content)
+        # Only mark the task processed once its plan is on disk, so a failed
+        # write is retried on the next event or restart
+        self._remember(task_file_path, mtime_ns)
+        self._append_ledger(task_file_path, mtime_ns)
         
         print(f"Created plan: {plan_filename}")
         
@@ -75,25 +145,78 @@ class TaskProcessor:
         # For now, we'll just create the plan alongside the original task file
 
 
-class TaskProcessingHandler(FileSystemEventHandler):
+class TaskProcessingHandler(PatternMatchingEventHandler):
     """
     Event handler for processing new task files in Needs_Action.
+
+    Editors fire several events per save, so events only push back a
+    per-path deadline; a background thread sleeps on a Condition until the
+    earliest deadline and processes each path once it has been quiet for
+    DEBOUNCE_SECONDS. With nothing pending the thread does not wake at all.
     """
+
+    DEBOUNCE_SECONDS = 0.2
     
     def __init__(self, processor: TaskProcessor):
+        super().__init__(patterns=["*.md"], ignore_directories=True)
         self.processor = processor
+        self._deadlines = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._worker = threading.Thread(target=self._drain_pending, name="TaskDebounce", daemon=True)
+        self._worker.start()
+
+    def _schedule(self, path: str):
+        with self._cond:
+            self._deadlines[path] = time.monotonic() + self.DEBOUNCE_SECONDS
+            self._cond.notify()
+
+    def _next_ready(self) -> list:
+        """Block until some paths have settled (or stop() is called) and claim them."""
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                ready = [path for path, deadline in self._deadlines.items() if deadline <= now]
+                if ready:
+                    for path in ready:
+                        del self._deadlines[path]
+                    return ready
+                timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                self._cond.wait(timeout)
+            return []
+
+    def _drain_pending(self):
+        while True:
+            ready = self._next_ready()
+            if not ready:
+                return
+            for path in ready:
+                try:
+                    self.processor.process_task_file(path)
+                except FileNotFoundError:
+                    # Removed or renamed before it settled
+                    pass
+
+    def stop(self):
+        """Stop the debounce thread; pending paths are dropped."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._worker.join()
     
     def on_created(self, event):
-        if not event.is_directory and event.src_path.endswith('.md'):
-            print(f"New task detected in Needs_Action: {os.path.basename(event.src_path)}")
-            self.processor.process_task_file(event.src_path)
+        print(f"New task detected in Needs_Action: {os.path.basename(event.src_path)}")
+        self._schedule(event.src_path)
     
     def on_modified(self, event):
-        if not event.is_directory and event.src_path.endswith('.md'):
-            # Handle modifications too, in case a file is created empty and then filled
-            if event.src_path not in self.processor.processed_files:
-                print(f"Modified task detected in Needs_Action: {os.path.basename(event.src_path)}")
-                self.processor.process_task_file(event.src_path)
+        # A file created empty and then filled is planned from its final content;
+        # the debounce collapses the burst of events from one save
+        self._schedule(event.src_path)
+    
+    def on_closed(self, event):
+        # Emitted once the writer closes the file (inotify IN_CLOSE_WRITE); only
+        # available on Linux, so on_modified above still has to cover other platforms
+        self._schedule(event.src_path)
 
 
 class TaskProcessorMonitor:
@@ -105,21 +228,22 @@ class TaskProcessorMonitor:
         self.needs_action_path = needs_action_path
         self.plans_path = plans_path
         self.processor = TaskProcessor(needs_action_path, plans_path)
-        self.observer = Observer()
+        self.observer = get_observer()
+        self.watch = None
         self.handler = TaskProcessingHandler(self.processor)
     
     def start_monitoring(self):
         """
         Start monitoring the Needs_Action folder for new task files.
         """
-        self.observer.schedule(self.handler, self.needs_action_path, recursive=False)
-        self.observer.start()
+        self.watch = self.observer.schedule(self.handler, self.needs_action_path, recursive=False)
         print(f"Started monitoring {self.needs_action_path} for task processing...")
         
     def stop_monitoring(self):
         """
         Stop monitoring the Needs_Action folder.
         """
-        self.observer.stop()
-        self.observer.join()
+        detach(self.watch, self.handler)
+        self.watch = None
+        self.handler.stop()
         print("Stopped task processing monitor.")
\ No newline at end of file
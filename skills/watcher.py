@@ -1,25 +1,31 @@
 import os
-import time
+import signal
+import threading
 from datetime import datetime
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 
+try:
+    from skills.observer_pool import get_observer
+except ImportError:
+    # Run as a script from inside skills/
+    from observer_pool import get_observer
 
-class MarkdownHandler(FileSystemEventHandler):
+
+class MarkdownHandler(PatternMatchingEventHandler):
     def __init__(self, log_file_path):
+        super().__init__(patterns=['*.md'], ignore_directories=True)
         self.log_file_path = log_file_path
 
     def on_created(self, event):
-        if not event.is_directory and event.src_path.endswith('.md'):
-            filename = os.path.basename(event.src_path)
-            print(f'New Task Detected: {filename}')
-            
-            # Log the event
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            log_entry = f'[{timestamp}] New Task Detected: {filename}\n'
-            
-            with open(self.log_file_path, 'a', encoding='utf-8') as log_file:
-                log_file.write(log_entry)
+        filename = os.path.basename(event.src_path)
+        print(f'New Task Detected: {filename}')
+        
+        # Log the event
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        log_entry = f'[{timestamp}] New Task Detected: {filename}\n'
+        
+        with open(self.log_file_path, 'a', encoding='utf-8') as log_file:
+            log_file.write(log_entry)
 
 
 def main():
@@ -33,19 +39,18 @@ def main():
     os.makedirs(inbox_path, exist_ok=True)
     
     event_handler = MarkdownHandler(log_path)
-    observer = Observer()
-    observer.schedule(event_handler, path=inbox_path, recursive=False)
-    
     print(f'Starting watcher for {inbox_path}...')
-    observer.start()
+    observer = get_observer()
+    observer.schedule(event_handler, path=inbox_path, recursive=False)
     
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        observer.stop()
-        print('\nWatcher stopped.')
+    # Block until Ctrl-C / SIGTERM instead of waking every second
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    stop_event.wait()
     
+    observer.stop()
+    print('\nWatcher stopped.')
     observer.join()
 
 
@@ -14,31 +14,142 @@
 """
 
 import os
-import json
+import time
+import queue
+import asyncio
+import atexit
+import random
 import logging
+import functools
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+
+from skills.jsonl_log import json_bytes, json_loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# httpx with HTTP/2 support (pip install "httpx[http2]") is optional; when
+# installed, concurrent sends are multiplexed over a single connection
+# instead of opening one HTTP/1.1 connection per in-flight request
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# aiohttp is optional; when installed, async_send_text_message sends
+# natively on the caller's event loop instead of in a worker thread
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Exceptions raised by either transport
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if HTTPX_AVAILABLE else ())
+_REQUEST_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if HTTPX_AVAILABLE else ())
+
+
+# Characters stripped from recipient numbers ("+92 300-1234567" -> "923001234567")
+_PHONE_STRIP = str.maketrans('', '', '+ -')
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_to(to: str) -> str:
+    """Normalize a recipient phone number for the API (cached per number)."""
+    return to.translate(_PHONE_STRIP)
+
+
+# Audit trail: one JSON object per line, rotated by size
+AUDIT_LOG_PATH = Path("logs/whatsapp_audit.jsonl")
+AUDIT_MAX_BYTES = 1_048_576
+AUDIT_BACKUP_COUNT = 3
+
+_audit_logger: Optional[logging.Logger] = None
+_audit_logger_lock = threading.Lock()
+
+
+def get_audit_logger() -> logging.Logger:
+    """
+    Get the WhatsApp audit logger, creating it on first use.
+
+    Records go through a QueueHandler, so callers only enqueue; a
+    QueueListener thread writes them to a RotatingFileHandler, which
+    rolls the file over at AUDIT_MAX_BYTES instead of trimming it.
+    """
+    global _audit_logger
+    with _audit_logger_lock:
+        if _audit_logger is None:
+            AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = RotatingFileHandler(
+                AUDIT_LOG_PATH, maxBytes=AUDIT_MAX_BYTES, backupCount=AUDIT_BACKUP_COUNT, encoding='utf-8',
+                delay=True  # Don't create the file until the first audit record
+            )
+            file_handler.setFormatter(logging.Formatter('%(message)s'))
+
+            records: "queue.Queue[logging.LogRecord]" = queue.Queue()
+            listener = QueueListener(records, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
+
+            audit_logger = logging.getLogger('whatsapp.audit')
+            audit_logger.setLevel(logging.INFO)
+            audit_logger.propagate = False
+            audit_logger.addHandler(QueueHandler(records))
+            _audit_logger = audit_logger
+        return _audit_logger
+
+
+def open_async_session() -> "aiohttp.ClientSession":
+    """
+    Open an aiohttp session for sending several messages from async code.
+
+    Use it as an async context manager and pass it to
+    async_send_text_message(session=...), so the sends share one connection
+    pool and the session is closed on exit:
+
+        async with open_async_session() as session:
+            await client.async_send_text_message(to, text, session=session)
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+
+# mtime of the .env file last parsed by load_env()
+_ENV_MTIME: Optional[int] = None
+
 
 def load_env():
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file (skipped if unchanged)."""
+    global _ENV_MTIME
     env_path = Path('.env')
-    if env_path.exists():
-        with open(env_path, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    k, v = line.split('=', 1)
-                    os.environ.setdefault(k.strip(), v.strip())
-
-# Load environment on import
-load_env()
+    try:
+        mtime = env_path.stat().st_mtime_ns
+    except OSError:
+        return
+    if mtime == _ENV_MTIME:
+        return
+
+    for line in env_path.read_text(encoding='utf-8').splitlines():
+        s = line.strip()
+        if not s or s[0] == '#' or '=' not in s:
+            continue
+        k, _, v = s.partition('=')
+        os.environ.setdefault(k.strip(), v.strip())
+    _ENV_MTIME = mtime
 
 
 class WhatsAppCloudAPI:
@@ -51,40 +162,71 @@ class WhatsAppCloudAPI:
 
     BASE_URL = "https://graph.facebook.com"
 
+    # Fixed attribute set: the singleton is polled on every status check and
+    # send, and slot access skips the per-instance __dict__ lookup
+    __slots__ = (
+        'access_token', 'phone_number_id', 'business_account_id', 'api_version',
+        'enabled', '_mock_mode', '_configured', '_url_prefix', '_api_url_messages', '_headers',
+        '_http2_client', '_session', 'audit_log_path', '_audit_logger', '_status'
+    )
+
+    # Statuses worth retrying: rate limiting and transient server errors
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_ATTEMPTS = 5
+    MAX_BACKOFF_SECONDS = 32.0
+
     def __init__(self):
+        # Loaded here rather than on import, so importing the skill without
+        # using it costs no file I/O
+        load_env()
+        logger.setLevel(os.getenv('WHATSAPP_LOG_LEVEL', 'WARNING').upper())
+
         self.access_token = os.getenv('WHATSAPP_ACCESS_TOKEN', '')
         self.phone_number_id = os.getenv('WHATSAPP_PHONE_NUMBER_ID', '')
         self.business_account_id = os.getenv('WHATSAPP_BUSINESS_ACCOUNT_ID', '')
         self.api_version = os.getenv('WHATSAPP_API_VERSION', 'v21.0')
         self.enabled = os.getenv('WHATSAPP_ENABLED', 'false').lower() == 'true'
+        self._mock_mode = os.getenv('MOCK_MODE', 'false').lower() == 'true'
 
-        # Audit logging
-        self.audit_log_path = Path("logs/whatsapp_audit.json")
-        self.audit_log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Configuration is fixed once the env is read; evaluate it once
+        self._configured = self._check_configured()
+        self._url_prefix = f"{self.BASE_URL}/{self.api_version}/{self.phone_number_id}/"
+        self._api_url_messages = self._get_api_url("messages")
+        self._status = self._build_status()
+
+        # The token is fixed for the client's lifetime, so build headers once
+        self._headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json"
+        }
+
+        # Pooled connections with keep-alive and TLS reuse to graph.facebook.com:
+        # an HTTP/2 httpx client when available, else a requests session
+        self._http2_client = self._create_http2_client() if HTTPX_AVAILABLE else None
+        self._session = self._create_session() if self._http2_client is None else None
+
+        # Audit logging (JSONL, size-rotated); written off the send path
+        self.audit_log_path = AUDIT_LOG_PATH
+        self._audit_logger = get_audit_logger()
 
         self._log_init()
 
     def _log_init(self):
         """Log initialization status."""
-        if self.is_configured():
-            print(f"\n[ZOYA WHATSAPP] ✅ WhatsApp Cloud API initialized")
-            print(f"[ZOYA WHATSAPP] API Version: {self.api_version}")
-            print(f"[ZOYA WHATSAPP] Phone ID: {self.phone_number_id[:10]}...")
-            print(f"[ZOYA WHATSAPP] Status: ACTIVE")
-            logger.info("WhatsApp Cloud API initialized successfully")
+        if self._configured:
+            logger.info("[ZOYA WHATSAPP] ✅ WhatsApp Cloud API initialized | API Version: %s | "
+                        "Phone ID: %s... | Status: ACTIVE", self.api_version, self.phone_number_id[:10])
         else:
-            print(f"\n[ZOYA WHATSAPP] ⚠️ WhatsApp not configured")
-            print(f"[ZOYA WHATSAPP] Status: OFFLINE")
-            logger.warning("WhatsApp Cloud API not configured")
+            logger.warning("[ZOYA WHATSAPP] ⚠️ WhatsApp Cloud API not configured | Status: OFFLINE")
 
     def is_configured(self) -> bool:
         """Check if WhatsApp API is properly configured."""
-        # In demo/mock mode, consider configured if WHATSAPP_ENABLED=true
-        mock_mode = os.getenv('MOCK_MODE', 'false').lower() == 'true'
-        if mock_mode and self.enabled:
-            return True
+        return self._configured
 
-        return bool(
+    def _check_configured(self) -> bool:
+        """Evaluate the configuration from the env-derived settings."""
+        # In demo/mock mode, consider configured if WHATSAPP_ENABLED=true
+        return (self._mock_mode and self.enabled) or bool(
             self.enabled and
             self.access_token and
             self.access_token != 'your_whatsapp_access_token_here' and
@@ -92,28 +234,83 @@ class WhatsAppCloudAPI:
             self.phone_number_id != 'your_phone_number_id_here'
         )
 
-    def get_status(self) -> Dict[str, Any]:
-        """Get WhatsApp API status."""
-        return {
+    def get_status(self, copy: bool = False) -> Mapping[str, Any]:
+        """
+        Get WhatsApp API status.
+
+        The status is fixed once the client is built, so it is returned as
+        a read-only mapping built in __init__. Pass copy=True for a fresh
+        mutable dict.
+        """
+        return dict(self._status) if copy else self._status
+
+    def _build_status(self) -> Mapping[str, Any]:
+        """Build the read-only status mapping from the configured settings."""
+        return MappingProxyType({
             "enabled": self.enabled,
-            "configured": self.is_configured(),
+            "configured": self._configured,
             "api_version": self.api_version,
             "phone_number_id": self.phone_number_id[:10] + "..." if self.phone_number_id else None,
             "business_account_id": self.business_account_id[:10] + "..." if self.business_account_id else None,
-            "status": "🟢 Active" if self.is_configured() else "🔴 Offline",
-            "mcp_ready": self.is_configured()
-        }
+            "status": "🟢 Active" if self._configured else "🔴 Offline",
+            "mcp_ready": self._configured
+        })
 
     def _get_api_url(self, endpoint: str = "messages") -> str:
         """Build the API URL."""
-        return f"{self.BASE_URL}/{self.api_version}/{self.phone_number_id}/{endpoint}"
+        return self._url_prefix + endpoint
+
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with connection pooling."""
+        # Transport-level retries cover connection errors only, where the
+        # request never reached the server; a POST that failed on read may
+        # already have sent the message. Status retries (429/5xx) are
+        # handled by _request()
+        retry = Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return session
+
+    def _create_http2_client(self) -> "httpx.Client":
+        """Create an HTTP/2 client; retries connection errors like the session."""
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+        return httpx.Client(transport=transport, headers=self._headers, timeout=30.0)
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get API request headers."""
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+    def _retry_delay(self, response, attempt: int) -> float:
+        """Seconds to wait before retrying, honoring Retry-After when sent."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(self.MAX_BACKOFF_SECONDS, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form; use the computed backoff instead
+        return min(self.MAX_BACKOFF_SECONDS, 0.5 * 2 ** attempt) + random.uniform(0, 0.25)
+
+    def _request(self, method: str, url: str, body: Optional[bytes] = None):
+        """
+        Send an API request over the pooled connections.
+
+        Rate-limit (429) and transient 5xx responses are retried with
+        exponential backoff plus jitter, up to MAX_ATTEMPTS attempts; the
+        last response is returned either way.
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            if self._http2_client is not None:
+                response = self._http2_client.request(method, url, content=body)
+            else:
+                response = self._session.request(method, url, headers=self._headers, timeout=30, data=body)
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_ATTEMPTS - 1:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            logger.warning("WhatsApp API returned %d, retrying in %.1fs", response.status_code, delay)
+            response.close()
+            time.sleep(delay)
 
     def _log_to_audit(self, action: str, status: str, details: Dict):
         """Log action to audit trail."""
@@ -125,19 +322,7 @@ class WhatsAppCloudAPI:
             "details": details
         }
 
-        # Load existing logs
-        logs = []
-        if self.audit_log_path.exists():
-            try:
-                with open(self.audit_log_path, encoding='utf-8') as f:
-                    logs = json.load(f)
-            except:
-                logs = []
-
-        logs.append(entry)
-
-        with open(self.audit_log_path, 'w', encoding='utf-8') as f:
-            json.dump(logs[-100:], f, indent=2)
+        self._audit_logger.info(json_bytes(entry).decode('utf-8'))
 
         return entry
 
@@ -152,13 +337,29 @@ class WhatsAppCloudAPI:
         Returns:
             Tuple of (success: bool, response: dict)
         """
-        if not self.is_configured():
+        if not self._configured:
             error_msg = "WhatsApp API not configured"
-            print(f"[ZOYA WHATSAPP] ❌ {error_msg}")
+            logger.error("[ZOYA WHATSAPP] ❌ %s", error_msg)
             return (False, {"error": error_msg, "status": "not_configured"})
 
-        # Clean phone number (remove + and spaces)
-        to_clean = to.replace("+", "").replace(" ", "").replace("-", "")
+        to_clean, body = self._prepare_text(to, message)
+
+        try:
+            response = self._request("POST", self._api_url_messages, body)
+            return self._text_result(response.status_code, response.content, to_clean, message)
+
+        except _TIMEOUT_ERRORS:
+            logger.error("[ZOYA WHATSAPP] ❌ Request timeout")
+            return (False, {"error": "Request timeout", "status": "timeout"})
+        except _REQUEST_ERRORS + (ValueError,) as e:
+            # ValueError: response body was not JSON
+            logger.error("[ZOYA WHATSAPP] ❌ Request error: %s", e)
+            return (False, {"error": str(e), "status": "request_error"})
+
+    def _prepare_text(self, to: str, message: str) -> Tuple[str, bytes]:
+        """Clean the recipient and encode the text message request body."""
+        # Clean phone number (remove +, spaces and dashes)
+        to_clean = _clean_to(to)
 
         payload = {
             "messaging_product": "whatsapp",
@@ -171,60 +372,136 @@ class WhatsAppCloudAPI:
             }
         }
 
-        print(f"\n[ZOYA WHATSAPP] 📤 Sending message to {to_clean[:6]}***")
-        print(f"[ZOYA WHATSAPP] Message: {message[:50]}...")
+        logger.info("[ZOYA WHATSAPP] 📤 Sending message to %s*** | Message: %s...", to_clean[:6], message[:50])
 
-        try:
-            response = requests.post(
-                self._get_api_url("messages"),
-                headers=self._get_headers(),
-                json=payload,
-                timeout=30
-            )
+        # Encoded here and sent as-is; self._headers already sets the JSON content type
+        return to_clean, json_bytes(payload)
 
-            response_data = response.json()
+    def _text_result(self, status_code: int, content: bytes, to_clean: str, message: str) -> Tuple[bool, Dict]:
+        """Turn a text message API response into the (success, response) result."""
+        response_data = json_loads(content)
 
-            if response.status_code == 200:
-                message_id = response_data.get("messages", [{}])[0].get("id", "unknown")
-                print(f"[ZOYA WHATSAPP] ✅ Message sent successfully!")
-                print(f"[ZOYA WHATSAPP] Message ID: {message_id}")
+        if status_code == 200:
+            message_id = response_data.get("messages", [{}])[0].get("id", "unknown")
+            logger.info("[ZOYA WHATSAPP] ✅ Message sent successfully! | Message ID: %s", message_id)
 
-                self._log_to_audit("SEND_TEXT", "SUCCESS", {
-                    "to": to_clean[:6] + "***",
-                    "message_preview": message[:50],
-                    "message_id": message_id
-                })
+            self._log_to_audit("SEND_TEXT", "SUCCESS", {
+                "to": to_clean[:6] + "***",
+                "message_preview": message[:50],
+                "message_id": message_id
+            })
 
-                return (True, {
-                    "success": True,
-                    "message_id": message_id,
-                    "status": "sent",
-                    "to": to_clean
-                })
-            else:
-                error = response_data.get("error", {})
-                error_msg = error.get("message", "Unknown error")
-                print(f"[ZOYA WHATSAPP] ❌ Failed: {error_msg}")
+            return (True, {
+                "success": True,
+                "message_id": message_id,
+                "status": "sent",
+                "to": to_clean
+            })
+        else:
+            error = response_data.get("error", {})
+            error_msg = error.get("message", "Unknown error")
+            logger.error("[ZOYA WHATSAPP] ❌ Failed: %s", error_msg)
+
+            self._log_to_audit("SEND_TEXT", "FAILED", {
+                "to": to_clean[:6] + "***",
+                "error": error_msg,
+                "status_code": status_code
+            })
+
+            return (False, {
+                "success": False,
+                "error": error_msg,
+                "status_code": status_code
+            })
+
+    async def async_send_text_message(self, to: str, message: str,
+                                      session: Optional["aiohttp.ClientSession"] = None) -> Tuple[bool, Dict]:
+        """
+        Send a text message without blocking the event loop.
 
-                self._log_to_audit("SEND_TEXT", "FAILED", {
-                    "to": to_clean[:6] + "***",
-                    "error": error_msg,
-                    "status_code": response.status_code
-                })
+        Sends natively with aiohttp when it is installed; otherwise runs
+        send_text_message in a worker thread. Without a session, one is
+        opened for this call and closed before returning.
 
-                return (False, {
-                    "success": False,
-                    "error": error_msg,
-                    "status_code": response.status_code
-                })
+        Args:
+            to: Recipient phone number (with country code, e.g., "923001234567")
+            message: Text message to send
+            session: Session from open_async_session() to reuse across sends
 
-        except requests.exceptions.Timeout:
-            print(f"[ZOYA WHATSAPP] ❌ Request timeout")
+        Returns:
+            Tuple of (success: bool, response: dict)
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.send_text_message, to, message)
+
+        if not self._configured:
+            error_msg = "WhatsApp API not configured"
+            logger.error("[ZOYA WHATSAPP] ❌ %s", error_msg)
+            return (False, {"error": error_msg, "status": "not_configured"})
+
+        to_clean, body = self._prepare_text(to, message)
+        if session is None:
+            async with open_async_session() as session:
+                return await self._async_post_text(session, to_clean, body, message)
+        return await self._async_post_text(session, to_clean, body, message)
+
+    async def _async_post_text(self, session: "aiohttp.ClientSession", to_clean: str,
+                               body: bytes, message: str) -> Tuple[bool, Dict]:
+        try:
+            # Same status-based retry policy as _request()
+            for attempt in range(self.MAX_ATTEMPTS):
+                async with session.post(self._api_url_messages, data=body, headers=self._headers) as response:
+                    status_code = response.status
+                    content = await response.read()
+                    if status_code not in self.RETRY_STATUSES or attempt == self.MAX_ATTEMPTS - 1:
+                        break
+                    delay = self._retry_delay(response, attempt)
+                logger.warning("WhatsApp API returned %d, retrying in %.1fs", status_code, delay)
+                await asyncio.sleep(delay)
+
+            return self._text_result(status_code, content, to_clean, message)
+
+        except asyncio.TimeoutError:
+            logger.error("[ZOYA WHATSAPP] ❌ Request timeout")
             return (False, {"error": "Request timeout", "status": "timeout"})
-        except requests.exceptions.RequestException as e:
-            print(f"[ZOYA WHATSAPP] ❌ Request error: {e}")
+        except (aiohttp.ClientError, ValueError) as e:
+            # ValueError: response body was not JSON
+            logger.error("[ZOYA WHATSAPP] ❌ Request error: %s", e)
             return (False, {"error": str(e), "status": "request_error"})
 
+    def send_text_messages_bulk(self, messages: List[Tuple[str, str]], max_workers: int = 20) -> List[Tuple[bool, Dict]]:
+        """
+        Send several text messages concurrently.
+
+        The Graph API has no batch endpoint for messages, so each message is
+        its own request; running them on a thread pool over the pooled
+        session makes the batch take about one round-trip instead of N.
+
+        Args:
+            messages: List of (to, message) pairs
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            List of (success, response) tuples, in the same order as messages
+        """
+        results: List[Tuple[bool, Dict]] = [None] * len(messages)
+        if not messages:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(messages))) as executor:
+            futures = {
+                executor.submit(self.send_text_message, to, message): index
+                for index, (to, message) in enumerate(messages)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = (False, {"error": str(e)})
+
+        return results
+
     def send_template_message(self, to: str, template_name: str, language_code: str = "en_US", components: list = None) -> Tuple[bool, Dict]:
         """
         Send a template message via WhatsApp Cloud API.
@@ -238,10 +515,10 @@ class WhatsAppCloudAPI:
         Returns:
             Tuple of (success: bool, response: dict)
         """
-        if not self.is_configured():
+        if not self._configured:
             return (False, {"error": "WhatsApp API not configured"})
 
-        to_clean = to.replace("+", "").replace(" ", "").replace("-", "")
+        to_clean = _clean_to(to)
 
         payload = {
             "messaging_product": "whatsapp",
@@ -259,22 +536,17 @@ class WhatsAppCloudAPI:
         if components:
             payload["template"]["components"] = components
 
-        print(f"\n[ZOYA WHATSAPP] 📤 Sending template '{template_name}' to {to_clean[:6]}***")
+        logger.info("[ZOYA WHATSAPP] 📤 Sending template '%s' to %s***", template_name, to_clean[:6])
 
         try:
-            response = requests.post(
-                self._get_api_url("messages"),
-                headers=self._get_headers(),
-                json=payload,
-                timeout=30
-            )
+            # Encoded here and sent as-is; self._headers already sets the JSON content type
+            response = self._request("POST", self._api_url_messages, json_bytes(payload))
 
-            response_data = response.json()
+            response_data = json_loads(response.content)
 
             if response.status_code == 200:
                 message_id = response_data.get("messages", [{}])[0].get("id", "unknown")
-                print(f"[ZOYA WHATSAPP] ✅ Template message sent!")
-                print(f"[ZOYA WHATSAPP] Message ID: {message_id}")
+                logger.info("[ZOYA WHATSAPP] ✅ Template message sent! | Message ID: %s", message_id)
 
                 self._log_to_audit("SEND_TEMPLATE", "SUCCESS", {
                     "to": to_clean[:6] + "***",
@@ -290,26 +562,26 @@ class WhatsAppCloudAPI:
                 })
             else:
                 error = response_data.get("error", {}).get("message", "Unknown error")
-                print(f"[ZOYA WHATSAPP] ❌ Failed: {error}")
+                logger.error("[ZOYA WHATSAPP] ❌ Failed: %s", error)
                 return (False, {"error": error})
 
         except Exception as e:
-            print(f"[ZOYA WHATSAPP] ❌ Error: {e}")
+            logger.error("[ZOYA WHATSAPP] ❌ Error: %s", e)
             return (False, {"error": str(e)})
 
     def get_phone_number_info(self) -> Tuple[bool, Dict]:
         """Get information about the registered phone number."""
-        if not self.is_configured():
+        if not self._configured:
             return (False, {"error": "WhatsApp API not configured"})
 
         try:
-            url = f"{self.BASE_URL}/{self.api_version}/{self.phone_number_id}"
-            response = requests.get(url, headers=self._get_headers(), timeout=30)
+            url = self._url_prefix[:-1]  # the phone number node itself
+            response = self._request("GET", url)
 
             if response.status_code == 200:
-                return (True, response.json())
+                return (True, json_loads(response.content))
             else:
-                return (False, response.json())
+                return (False, json_loads(response.content))
 
         except Exception as e:
             return (False, {"error": str(e)})
@@ -333,7 +605,7 @@ def is_whatsapp_active() -> bool:
     return client.is_configured()
 
 
-def get_whatsapp_status() -> Dict[str, Any]:
+def get_whatsapp_status() -> Mapping[str, Any]:
     """Get WhatsApp status for UI display."""
     client = get_whatsapp_client()
     return client.get_status()
@@ -345,6 +617,18 @@ def send_whatsapp_message(to: str, message: str) -> Tuple[bool, Dict]:
     return client.send_text_message(to, message)
 
 
+async def send_whatsapp_message_async(to: str, message: str) -> Tuple[bool, Dict]:
+    """Quick function to send a WhatsApp message from async code."""
+    client = get_whatsapp_client()
+    return await client.async_send_text_message(to, message)
+
+
+def send_whatsapp_messages_bulk(messages: List[Tuple[str, str]]) -> List[Tuple[bool, Dict]]:
+    """Quick function to send several WhatsApp messages concurrently."""
+    client = get_whatsapp_client()
+    return client.send_text_messages_bulk(messages)
+
+
 # MCP Tool wrapper for unified interface
 def mcp_whatsapp_send(params: Dict) -> Dict:
     """MCP tool wrapper for WhatsApp send."""
@@ -358,6 +642,36 @@ def mcp_whatsapp_send(params: Dict) -> Dict:
     return {"success": success, **result}
 
 
+async def mcp_whatsapp_send_async(params: Dict) -> Dict:
+    """Async MCP tool wrapper for WhatsApp send."""
+    to = params.get("to", "")
+    message = params.get("message", "")
+
+    if not to or not message:
+        return {"success": False, "error": "Missing 'to' or 'message' parameter"}
+
+    success, result = await send_whatsapp_message_async(to, message)
+    return {"success": success, **result}
+
+
+def mcp_whatsapp_send_bulk(params: Dict) -> Dict:
+    """MCP tool wrapper for sending several WhatsApp messages."""
+    messages = params.get("messages", [])
+    pairs = [(m.get("to", ""), m.get("message", "")) for m in messages]
+
+    if not pairs or not all(to and message for to, message in pairs):
+        return {"success": False, "error": "Each entry in 'messages' needs 'to' and 'message'"}
+
+    results = [{"success": success, **result} for success, result in send_whatsapp_messages_bulk(pairs)]
+    sent = sum(1 for r in results if r["success"])
+    return {
+        "success": sent == len(results),
+        "total": len(results),
+        "sent": sent,
+        "results": results
+    }
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("WhatsApp Cloud API - Connection Test")
@@ -17,31 +17,129 @@ This is intended for personal/business use monitoring your own messages.
 import os
 import re
 import json
+import mmap
+import atexit
+import struct
+import string
+import asyncio
+import hashlib
 import time
 import logging
 import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Set
+from typing import Optional, List, Dict, Set, Tuple
 from dataclasses import dataclass, asdict
 
 # Playwright imports - graceful handling if not installed
 try:
-    from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
-    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Hyperscan is optional: vectorized multi-literal matching for keywords
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 from skills.base_watcher import BaseWatcher
+from skills.async_loop import AsyncLoopThread, get_loop_thread
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Processed-ID ring file: a header (head index, slot count) followed by that
+# many slots of raw message digests, oldest overwritten first; all-zero slots
+# are empty
+_RING_HEADER = struct.Struct('<II')
+_DIGEST_SIZE = 8
 
-@dataclass
+# Markdown for action files, filled in by create_action_file
+_ACTION_FILE_TEMPLATE = string.Template("""---
+type: whatsapp
+message_id: $message_id
+sender: $sender
+sender_number: $sender_number
+is_group: $is_group
+group_name: $group_name
+timestamp: $timestamp
+detected_at: $detected_at
+priority: $priority
+has_media: $has_media
+status: pending
+---
+
+# WhatsApp Message from $sender
+
+## Message Details
+- **From:** $sender
+- **Time:** $timestamp
+- **Priority:** $priority_upper
+- **Type:** $chat_type
+$group_line
+- **Has Media:** $media_label
+
+## Message Content
+$content
+
+## Suggested Actions
+$suggested_actions
+
+## Processing Notes
+- [ ] Review message content
+- [ ] Determine appropriate response
+- [ ] Move to /Approved when ready to act
+
+---
+*Detected by WhatsApp Watcher at $detected_at_display*
+*AI Employee Zoya - Automated Message Processing*
+""")
+
+# Page scripts that read a whole batch of elements in one round-trip,
+# instead of one query_selector/inner_text call per field per element
+_UNREAD_CHATS_JS = """(chats, sel) => chats.map(chat => {
+    const unread = chat.querySelector(sel.unread_chat);
+    if (!unread) return null;
+    const name = chat.querySelector('span[title]');
+    return {name: name ? name.getAttribute('title') : 'Unknown', unread: unread.innerText};
+})"""
+
+_UNREAD_CHATS_ON_HANDLES_JS = f"""([chats, sel]) => ({_UNREAD_CHATS_JS})(chats, sel)"""
+
+_RECENT_MESSAGES_JS = """(msgs, [max, sel]) => msgs.slice(-max).map(msg => {
+    const text = msg.querySelector(sel.message_text);
+    const sender = msg.querySelector(sel.sender_name);
+    const time = msg.querySelector(sel.timestamp);
+    return {
+        content: text ? text.innerText : '',
+        sender: sender ? sender.innerText : null,
+        timestamp: time ? time.innerText : null,
+        has_media: msg.querySelector('img, video, audio') !== null,
+    };
+})"""
+
+# Labels of all unread badges, e.g. "3 unread messages"; changes whenever a
+# message arrives in any chat that is not open
+_UNREAD_SIGNATURE_JS = """sel => [...document.querySelectorAll(sel)]
+    .map(badge => badge.getAttribute('aria-label')).join('|')"""
+
+_UNREAD_CHANGED_JS = f"""([sel, before]) => ({_UNREAD_SIGNATURE_JS})(sel) !== before"""
+
+
+@dataclass(frozen=True)
 class WhatsAppMessage:
     """Represents a WhatsApp message."""
+    __slots__ = (
+        'message_id', 'sender', 'sender_number', 'content', 'timestamp',
+        'is_group', 'group_name', 'has_media', 'priority'
+    )
+
     message_id: str
     sender: str
     sender_number: str
@@ -53,6 +151,133 @@ class WhatsAppMessage:
     priority: str
 
 
+class KeywordMatcher:
+    """
+    Counts keywords from several named groups in a single scan.
+
+    Each distinct keyword is tested once against the text, however many
+    groups list it, and the hits are tallied per group. With Hyperscan
+    installed all keywords are found in one pass over the text; otherwise
+    each is a substring test. Keywords are lowercase and the text is
+    lowercased inside the cached call, so priority and suggested actions
+    for the same message share one lowercasing and one scan.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self._categories: Dict[str, Set[str]] = {}
+        for category, keywords in groups.items():
+            for kw in keywords:
+                self._categories.setdefault(kw, set()).add(category)
+        self._keywords = tuple(self._categories.items())
+
+        self._db = None
+        if HYPERSCAN_AVAILABLE:
+            # One database over every keyword; each reports at most once
+            self._db = hyperscan.Database()
+            self._db.compile(
+                expressions=[re.escape(kw).encode('utf-8') for kw, _ in self._keywords],
+                ids=list(range(len(self._keywords))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self._keywords)
+            )
+            # The database's scratch space cannot be shared by concurrent scans
+            self._db_lock = threading.Lock()
+
+        self.count = lru_cache(maxsize=128)(self._count)
+
+    def _count(self, text: str) -> Counter:
+        """Return how many distinct keywords of each group occur in text, ignoring case."""
+        text = text.lower()
+        counts = Counter()
+        if self._db is not None:
+            hits = []
+            with self._db_lock:
+                self._db.scan(
+                    text.encode('utf-8'),
+                    match_event_handler=lambda kw_id, start, end, flags, ctx: hits.append(kw_id)
+                )
+            for kw_id in hits:
+                counts.update(self._keywords[kw_id][1])
+            return counts
+
+        for kw, categories in self._keywords:
+            if kw in text:
+                counts.update(categories)
+        return counts
+
+
+class _ContextPool:
+    """
+    Process-wide pool of persistent browser contexts.
+
+    Launching Chromium on a persistent profile takes seconds and a profile
+    directory can only be open once per process, so contexts are kept warm
+    and shared, keyed by (session_path, headless). Watchers close their
+    page on stop and leave the context running for the next start.
+
+    Everything runs on the shared asyncio loop thread, which owns the
+    Playwright driver for the life of the process.
+    """
+
+    LAUNCH_ARGS = [
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--no-sandbox'
+    ]
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+    def __init__(self):
+        # Created on the loop thread; before Python 3.10 asyncio primitives
+        # bind to the loop that is current when they are constructed
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright = None
+        self._contexts: Dict[Tuple[str, bool], 'BrowserContext'] = {}
+
+    async def acquire(self, session_path: Path, headless: bool) -> 'BrowserContext':
+        """Get the context for a session, launching it on first use."""
+        key = (str(Path(session_path).resolve()), headless)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            context = self._contexts.get(key)
+            if context is None:
+                if self._playwright is None:
+                    self._loop = asyncio.get_running_loop()
+                    self._playwright = await async_playwright().start()
+                # Use persistent context to maintain WhatsApp session
+                context = await self._playwright.chromium.launch_persistent_context(
+                    user_data_dir=key[0],
+                    headless=headless,
+                    args=self.LAUNCH_ARGS,
+                    viewport={'width': 1280, 'height': 800},
+                    user_agent=self.USER_AGENT
+                )
+                context.on("close", lambda _: self._contexts.pop(key, None))
+                self._contexts[key] = context
+            return context
+
+    async def _close_all(self) -> None:
+        contexts, self._contexts = list(self._contexts.values()), {}
+        playwright, self._playwright = self._playwright, None
+        for context in contexts:
+            await context.close()
+        if playwright:
+            await playwright.stop()
+
+    def close_all(self, timeout: float = 10.0) -> None:
+        """Close every pooled context and stop Playwright; safe from any thread."""
+        if self._loop is None or not self._loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), self._loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+
+
+_context_pool = _ContextPool()
+atexit.register(_context_pool.close_all)
+
+
 class WhatsAppWatcher(BaseWatcher):
     """
     Concrete implementation of BaseWatcher that monitors WhatsApp Web for new messages.
@@ -81,9 +306,50 @@ class WhatsAppWatcher(BaseWatcher):
         'deliverable', 'milestone', 'client', 'customer', 'vendor'
     ]
 
+    # Keyword buckets that drive the suggested actions in action files
+    ACTION_KEYWORDS = {
+        'payment': ['invoice', 'payment', 'pay', 'price', 'cost', 'quote'],
+        'meeting': ['meeting', 'schedule', 'call', 'appointment', 'available'],
+        'deadline': ['deadline', 'due', 'urgent', 'asap'],
+        'support': ['help', 'support', 'issue', 'problem', 'error'],
+        'order': ['order', 'delivery', 'shipping', 'tracking'],
+        'project': ['project', 'proposal', 'contract'],
+    }
+
+    # Checklist items added for each matched action bucket, in file order
+    ACTION_STEPS = [
+        ('payment', ["- [ ] Review payment/pricing details",
+                     "- [ ] Prepare invoice or quote if needed"]),
+        ('meeting', ["- [ ] Check calendar availability",
+                     "- [ ] Schedule meeting or call"]),
+        ('deadline', ["- [ ] Prioritize this request",
+                      "- [ ] Assess timeline and resources"]),
+        ('support', ["- [ ] Investigate the issue",
+                     "- [ ] Provide support/assistance"]),
+        ('order', ["- [ ] Check order status",
+                   "- [ ] Provide tracking/delivery information"]),
+        ('project', ["- [ ] Review project requirements",
+                     "- [ ] Prepare necessary documentation"]),
+    ]
+
+    # All keyword groups, matched together in one pass per message
+    KEYWORDS = KeywordMatcher({
+        'urgent': URGENT_KEYWORDS,
+        'business': BUSINESS_KEYWORDS,
+        **ACTION_KEYWORDS,
+    })
+
     # VIP contacts that should always be flagged (add phone numbers or names)
     VIP_CONTACTS: List[str] = []
 
+    # WhatsApp Web leaks detached DOM nodes over long sessions; the page is
+    # replaced once it holds more than MAX_DOM_NODES (checked every 5 min)
+    MAX_DOM_NODES = 50000
+    DOM_CHECK_INTERVAL = 300
+
+    # Processed message IDs kept for dedup; the oldest are evicted first
+    MAX_PROCESSED_IDS = 2000
+
     # WhatsApp Web selectors (may need updates if WhatsApp changes their UI)
     SELECTORS = {
         'qr_code': 'canvas[aria-label="Scan me!"]',
@@ -126,24 +392,33 @@ class WhatsAppWatcher(BaseWatcher):
         self.headless = headless
         self.max_messages_per_chat = max_messages_per_chat
 
-        # Track processed message IDs to avoid duplicates
-        self.processed_ids: Set[str] = set()
-        self.processed_ids_file = Path("logs/whatsapp_processed_ids.json")
+        # Track processed message IDs to avoid duplicates, oldest first
+        self.processed_ids: OrderedDict = OrderedDict()
+        self.processed_ids_file = Path("logs/whatsapp_processed_ids.bin")
+        self._ring: Optional[mmap.mmap] = None
+        self._ring_head = 0
 
-        # Playwright instances
-        self.playwright = None
+        # Playwright instances; the context is shared through _context_pool
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._cdp = None
+        self._last_dom_check = 0.0
 
-        # Threading
-        self._monitor_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        # Browser work runs as coroutines on the shared asyncio loop thread
+        self._loop_thread: Optional[AsyncLoopThread] = None
+        self._monitor_future = None
+        self._stop_event: Optional[asyncio.Event] = None
 
         # State tracking
         self.is_authenticated = False
         self.last_check_time = None
 
+        # WebSocket frames received from WhatsApp Web; a check only scrapes
+        # the DOM when new frames arrived since the previous scrape
+        self._ws_frames = 0
+        self._ws_frames_scanned = -1
+
         # Load previously processed IDs
         self._load_processed_ids()
 
@@ -154,54 +429,107 @@ class WhatsAppWatcher(BaseWatcher):
         logger.info(f"WhatsAppWatcher initialized. Output: {self.output_path}")
 
     def _load_processed_ids(self) -> None:
-        """Load previously processed message IDs from file."""
+        """Load previously processed message IDs and map the ring file for appends."""
+        slots = self.MAX_PROCESSED_IDS
+        size = _RING_HEADER.size + slots * _DIGEST_SIZE
         try:
-            if self.processed_ids_file.exists():
-                with open(self.processed_ids_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.processed_ids = set(data.get('processed_ids', []))
-                    logger.info(f"Loaded {len(self.processed_ids)} processed WhatsApp message IDs")
+            self.ensure_directory_exists(str(self.processed_ids_file.parent))
+            fd = os.open(self.processed_ids_file, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(fd, 'r+b') as f:
+                data = f.read()
+                if len(data) != size:
+                    f.truncate(size)
+                self._ring = mmap.mmap(f.fileno(), size)
+
+            # Walk the old ring from its head (the oldest slot) around; a
+            # file whose size or head disagrees with its header is truncated
+            # or corrupt and starts over empty
+            digests = []
+            head = count = 0
+            if len(data) >= _RING_HEADER.size:
+                head, count = _RING_HEADER.unpack_from(data)
+            if head < count and len(data) == _RING_HEADER.size + count * _DIGEST_SIZE:
+                body = memoryview(data)[_RING_HEADER.size:]
+                for i in range(count):
+                    off = ((head + i) % count) * _DIGEST_SIZE
+                    digest = bytes(body[off:off + _DIGEST_SIZE])
+                    if any(digest):
+                        digests.append(digest)
+            elif data:
+                logger.warning(f"Ignoring corrupt processed-ID file {self.processed_ids_file}")
+            digests = digests[-slots:]
+
+            for digest in digests:
+                self.processed_ids[f"wa_{digest.hex()}"] = None
+
+            if count == slots and len(data) == size and head < slots:
+                self._ring_head = head
+            else:
+                # New or corrupt file, or MAX_PROCESSED_IDS changed: lay the
+                # IDs out afresh
+                self._ring[:] = bytes(size)
+                for i, digest in enumerate(digests):
+                    off = _RING_HEADER.size + i * _DIGEST_SIZE
+                    self._ring[off:off + _DIGEST_SIZE] = digest
+                self._ring_head = len(digests) % slots
+                _RING_HEADER.pack_into(self._ring, 0, self._ring_head, slots)
+
+            if self.processed_ids:
+                logger.info(f"Loaded {len(self.processed_ids)} processed WhatsApp message IDs")
         except Exception as e:
             logger.warning(f"Could not load processed IDs: {e}")
-            self.processed_ids = set()
+            self.processed_ids = OrderedDict()
+            self._ring = None
+
+    def _remember_id(self, msg_id: str) -> None:
+        """Record a processed message ID, evicting the oldest beyond the cap."""
+        if msg_id not in self.processed_ids and self._ring is not None:
+            try:
+                digest = bytes.fromhex(msg_id[3:])
+            except ValueError:
+                digest = b''
+            if len(digest) == _DIGEST_SIZE:
+                off = _RING_HEADER.size + self._ring_head * _DIGEST_SIZE
+                self._ring[off:off + _DIGEST_SIZE] = digest
+                self._ring_head = (self._ring_head + 1) % self.MAX_PROCESSED_IDS
+                _RING_HEADER.pack_into(self._ring, 0, self._ring_head, self.MAX_PROCESSED_IDS)
+
+        self.processed_ids[msg_id] = None
+        self.processed_ids.move_to_end(msg_id)
+        while len(self.processed_ids) > self.MAX_PROCESSED_IDS:
+            self.processed_ids.popitem(last=False)
+
+    @staticmethod
+    def _message_id(chat_name: str, sender: str, timestamp: str, content: str,
+                    day: Optional[str] = None) -> str:
+        """
+        Build a stable message ID from the message itself.
+
+        Uses BLAKE2b rather than hash(), whose per-process salt gave the same
+        message a new ID after every restart. day defaults to today's date.
+        """
+        if day is None:
+            day = str(datetime.now().date())
+        key = f"{chat_name}|{sender}|{day}|{timestamp}|{content}"
+        return f"wa_{hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()}"
 
     def _save_processed_ids(self) -> None:
-        """Save processed message IDs to file for persistence."""
+        """Flush IDs recorded since the last save to disk."""
         try:
-            self.ensure_directory_exists(str(self.processed_ids_file.parent))
-            # Keep only last 500 IDs to prevent unbounded growth
-            ids_list = list(self.processed_ids)[-500:]
-            with open(self.processed_ids_file, 'w') as f:
-                json.dump({
-                    'processed_ids': ids_list,
-                    'updated': datetime.now().isoformat()
-                }, f)
+            if self._ring is not None:
+                self._ring.flush()
         except Exception as e:
             logger.error(f"Could not save processed IDs: {e}")
 
-    def _initialize_browser(self) -> bool:
+    async def _initialize_browser(self) -> bool:
         """Initialize Playwright browser with persistent context."""
         if not PLAYWRIGHT_AVAILABLE:
             logger.error("Playwright not installed. Run: pip install playwright && playwright install chromium")
             return False
 
         try:
-            self.playwright = sync_playwright().start()
-
-            # Use persistent context to maintain WhatsApp session
-            self.context = self.playwright.chromium.launch_persistent_context(
-                user_data_dir=str(self.session_path),
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox'
-                ],
-                viewport={'width': 1280, 'height': 800},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-
-            self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+            self.context = await _context_pool.acquire(self.session_path, self.headless)
+            await self._open_page()
 
             logger.info("Browser initialized successfully")
             return True
@@ -210,17 +538,66 @@ class WhatsAppWatcher(BaseWatcher):
             logger.error(f"Failed to initialize browser: {e}")
             return False
 
-    def _navigate_to_whatsapp(self) -> bool:
+    async def _open_page(self) -> None:
+        """Take the context's idle page, or open a new one, and hook it up."""
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+        self.page.on("websocket", self._on_websocket)
+        self._cdp = None
+        self._last_dom_check = time.monotonic()
+
+    async def _close_page(self) -> None:
+        """Close this watcher's page, leaving the pooled context running."""
+        try:
+            if self.page and not self.page.is_closed():
+                await self.page.close()
+        except Exception as e:
+            logger.warning(f"Error closing page: {e}")
+        self.page = None
+        self._cdp = None
+
+    async def _check_dom_health(self) -> None:
+        """Replace the page if WhatsApp Web has accumulated too many DOM nodes."""
+        if time.monotonic() - self._last_dom_check < self.DOM_CHECK_INTERVAL:
+            return
+        self._last_dom_check = time.monotonic()
+
+        try:
+            if self._cdp is None:
+                self._cdp = await self.context.new_cdp_session(self.page)
+            nodes = (await self._cdp.send("Memory.getDOMCounters"))['nodes']
+        except Exception as e:
+            logger.debug(f"DOM counter check failed: {e}")
+            return
+
+        if nodes <= self.MAX_DOM_NODES:
+            return
+
+        logger.warning(f"WhatsApp Web holds {nodes} DOM nodes, reopening the page")
+        await self._close_page()
+        await self._open_page()
+        self.is_authenticated = False
+        self._ws_frames_scanned = -1
+        if await self._navigate_to_whatsapp():
+            await self._wait_for_authentication()
+
+    def _on_websocket(self, ws) -> None:
+        """Count frames on WhatsApp Web's WebSocket as a cheap activity signal."""
+        ws.on("framereceived", self._on_ws_frame)
+
+    def _on_ws_frame(self, payload) -> None:
+        self._ws_frames += 1
+
+    async def _navigate_to_whatsapp(self) -> bool:
         """Navigate to WhatsApp Web and wait for load."""
         try:
-            self.page.goto('https://web.whatsapp.com', wait_until='networkidle', timeout=60000)
+            await self.page.goto('https://web.whatsapp.com', wait_until='networkidle', timeout=60000)
             logger.info("Navigated to WhatsApp Web")
             return True
         except Exception as e:
             logger.error(f"Failed to navigate to WhatsApp Web: {e}")
             return False
 
-    def _wait_for_authentication(self, timeout: int = 120) -> bool:
+    async def _wait_for_authentication(self, timeout: int = 120) -> bool:
         """
         Wait for user to scan QR code or for existing session to load.
 
@@ -231,20 +608,27 @@ class WhatsAppWatcher(BaseWatcher):
             True if authenticated, False if timeout
         """
         logger.info("Waiting for WhatsApp authentication...")
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        qr_reported = False
 
-        while time.time() - start_time < timeout:
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                # Check if we're already logged in (chat list visible)
-                chat_list = self.page.query_selector(self.SELECTORS['side_panel'])
-                if chat_list:
-                    logger.info("WhatsApp Web authenticated successfully")
-                    self.is_authenticated = True
-                    return True
-
+                # Returns as soon as the chat list shows up (already logged in)
+                await self.page.wait_for_selector(
+                    self.SELECTORS['side_panel'],
+                    timeout=min(remaining, 2.0) * 1000
+                )
+                logger.info("WhatsApp Web authenticated successfully")
+                self.is_authenticated = True
+                return True
+
+            except PlaywrightTimeoutError:
                 # Check if QR code is displayed
-                qr_code = self.page.query_selector(self.SELECTORS['qr_code'])
-                if qr_code:
+                if not qr_reported and await self.page.query_selector(self.SELECTORS['qr_code']):
+                    qr_reported = True
                     if self.headless:
                         logger.warning("QR code displayed but running in headless mode!")
                         logger.warning("Run with headless=False for first authentication")
@@ -252,16 +636,17 @@ class WhatsAppWatcher(BaseWatcher):
                     else:
                         logger.info("Please scan the QR code with your phone...")
 
-                time.sleep(2)
-
             except Exception as e:
                 logger.debug(f"Auth check error: {e}")
-                time.sleep(2)
+                await self._sleep(2)
 
-        logger.error("Authentication timeout - QR code not scanned in time")
+        if self._stop_event.is_set():
+            logger.info("Stopped while waiting for WhatsApp authentication")
+        else:
+            logger.error("Authentication timeout - QR code not scanned in time")
         return False
 
-    def _get_unread_chats(self) -> List[Dict]:
+    async def _get_unread_chats(self) -> List[Dict]:
         """
         Get list of chats with unread messages.
 
@@ -272,33 +657,32 @@ class WhatsAppWatcher(BaseWatcher):
 
         try:
             # Wait for chat list to be available
-            self.page.wait_for_selector(self.SELECTORS['chat_list'], timeout=10000)
-
-            # Find all chat items with unread indicators
-            chat_items = self.page.query_selector_all(self.SELECTORS['chat_item'])
+            await self.page.wait_for_selector(self.SELECTORS['chat_list'], timeout=10000)
 
-            for chat in chat_items:
-                try:
-                    # Check for unread indicator
-                    unread = chat.query_selector(self.SELECTORS['unread_chat'])
-                    if unread:
-                        # Get chat name
-                        name_elem = chat.query_selector('span[title]')
-                        chat_name = name_elem.get_attribute('title') if name_elem else 'Unknown'
-
-                        # Get unread count
-                        unread_text = unread.inner_text()
-                        unread_count = int(unread_text) if unread_text.isdigit() else 1
-
-                        unread_chats.append({
-                            'name': chat_name,
-                            'element': chat,
-                            'unread_count': unread_count
-                        })
-
-                except Exception as e:
-                    logger.debug(f"Error processing chat item: {e}")
-                    continue
+            # Read every chat's unread indicator in the page, without handles
+            details = await self.page.eval_on_selector_all(
+                self.SELECTORS['chat_item'], _UNREAD_CHATS_JS, self.SELECTORS
+            )
+            if not any(details):
+                return unread_chats
+
+            # Only now take handles (needed to click), re-reading the
+            # indicators against them so names and elements line up
+            chat_items = await self.page.query_selector_all(self.SELECTORS['chat_item'])
+            details = await self.page.evaluate(_UNREAD_CHATS_ON_HANDLES_JS, [chat_items, self.SELECTORS])
+
+            for chat, info in zip(chat_items, details):
+                if not info:
+                    await chat.dispose()
+                else:
+                    unread_text = info['unread']
+                    unread_count = int(unread_text) if unread_text.isdigit() else 1
+
+                    unread_chats.append({
+                        'name': info['name'],
+                        'element': chat,
+                        'unread_count': unread_count
+                    })
 
             if unread_chats:
                 logger.info(f"Found {len(unread_chats)} chats with unread messages")
@@ -310,65 +694,61 @@ class WhatsAppWatcher(BaseWatcher):
 
         return unread_chats
 
-    def _open_chat(self, chat_element) -> bool:
+    async def _open_chat(self, chat_element) -> bool:
         """Open a specific chat by clicking on it."""
         try:
-            chat_element.click()
-            time.sleep(1)  # Wait for chat to open
-            self.page.wait_for_selector(self.SELECTORS['main_panel'], timeout=5000)
+            await chat_element.click()
+            await self.page.wait_for_selector(self.SELECTORS['main_panel'], state='visible', timeout=5000)
             return True
         except Exception as e:
             logger.error(f"Failed to open chat: {e}")
             return False
 
-    def _extract_messages(self, chat_name: str, max_messages: int = 5) -> List[WhatsAppMessage]:
+    async def _extract_messages(self, chat_name: str, max_messages: int = 5,
+                                now: Optional[datetime] = None) -> List[WhatsAppMessage]:
         """
         Extract recent messages from the currently open chat.
 
         Args:
             chat_name: Name of the chat
             max_messages: Maximum messages to extract
+            now: Time of the current poll (default: now)
 
         Returns:
             List of WhatsAppMessage objects
         """
         messages = []
+        now = now or datetime.now()
+        day = str(now.date())
+        now_hhmm = now.strftime('%H:%M')
 
         try:
-            # Get incoming messages
-            msg_containers = self.page.query_selector_all(self.SELECTORS['message_in'])
-
-            # Process only recent messages (from the end)
-            recent_msgs = msg_containers[-max_messages:] if len(msg_containers) > max_messages else msg_containers
+            # Read text, sender, time and media flag of the most recent
+            # incoming messages in a single page call
+            fields = await self.page.eval_on_selector_all(
+                self.SELECTORS['message_in'], _RECENT_MESSAGES_JS, [max_messages, self.SELECTORS]
+            )
 
-            for msg in recent_msgs:
+            for msg in fields:
                 try:
-                    # Extract message text
-                    text_elem = msg.query_selector(self.SELECTORS['message_text'])
-                    content = text_elem.inner_text() if text_elem else ''
+                    content = msg['content']
 
                     if not content:
                         continue
 
+                    # Sender is only shown in group chats
+                    sender = msg['sender'] or chat_name
+                    timestamp = msg['timestamp'] or now_hhmm
+
                     # Generate message ID
-                    msg_id = f"wa_{hash(f'{chat_name}_{content[:50]}_{datetime.now().date()}')}"
+                    msg_id = self._message_id(chat_name, sender, timestamp, content, day)
 
                     if msg_id in self.processed_ids:
                         continue
 
-                    # Extract sender (for groups)
-                    sender_elem = msg.query_selector(self.SELECTORS['sender_name'])
-                    sender = sender_elem.inner_text() if sender_elem else chat_name
-
-                    # Extract timestamp
-                    time_elem = msg.query_selector(self.SELECTORS['timestamp'])
-                    timestamp = time_elem.inner_text() if time_elem else datetime.now().strftime('%H:%M')
-
                     # Check if group chat
-                    is_group = sender_elem is not None
-
-                    # Check for media
-                    has_media = msg.query_selector('img, video, audio') is not None
+                    is_group = msg['sender'] is not None
+                    has_media = msg['has_media']
 
                     # Determine priority
                     priority = self._determine_priority(content, sender)
@@ -403,26 +783,25 @@ class WhatsAppWatcher(BaseWatcher):
         Returns:
             'high', 'medium', or 'low'
         """
-        content_lower = content.lower()
-
-        # Check for VIP sender
-        is_vip = any(vip.lower() in sender.lower() for vip in self.VIP_CONTACTS)
-
-        # Count urgent keywords
-        urgent_count = sum(1 for kw in self.URGENT_KEYWORDS if kw in content_lower)
+        # VIP senders are always high priority; no need to scan the text
+        sender_lower = sender.lower()
+        if any(vip.lower() in sender_lower for vip in self.VIP_CONTACTS):
+            return 'high'
 
-        # Count business keywords
-        business_count = sum(1 for kw in self.BUSINESS_KEYWORDS if kw in content_lower)
+        # Count urgent and business keywords
+        counts = self.KEYWORDS.count(content)
+        urgent_count = counts['urgent']
+        business_count = counts['business']
 
         # Determine priority
-        if urgent_count >= 2 or is_vip:
+        if urgent_count >= 2:
             return 'high'
         elif urgent_count >= 1 or business_count >= 2:
             return 'medium'
         else:
             return 'low'
 
-    def check_for_updates(self) -> List[WhatsAppMessage]:
+    async def check_for_updates(self) -> List[WhatsAppMessage]:
         """
         Check WhatsApp for new messages.
 
@@ -434,26 +813,35 @@ class WhatsAppWatcher(BaseWatcher):
             return []
 
         all_messages = []
+        now = datetime.now()
 
         try:
+            # Skip the DOM scan entirely if the socket has been quiet
+            frames = self._ws_frames
+            if frames == self._ws_frames_scanned:
+                logger.debug("No WhatsApp Web traffic since last check")
+                self.last_check_time = now
+                return []
+            self._ws_frames_scanned = frames
+
             # Get chats with unread messages
-            unread_chats = self._get_unread_chats()
+            unread_chats = await self._get_unread_chats()
 
             for chat in unread_chats:
                 if self._stop_event.is_set():
                     break
 
                 # Open the chat
-                if self._open_chat(chat['element']):
+                if await self._open_chat(chat['element']):
                     # Extract messages
-                    messages = self._extract_messages(
+                    messages = await self._extract_messages(
                         chat['name'],
-                        min(chat['unread_count'], self.max_messages_per_chat)
+                        min(chat['unread_count'], self.max_messages_per_chat),
+                        now
                     )
                     all_messages.extend(messages)
 
-                    # Small delay between chats
-                    time.sleep(0.5)
+                await chat['element'].dispose()
 
             self.last_check_time = datetime.now()
 
@@ -472,99 +860,112 @@ class WhatsAppWatcher(BaseWatcher):
         Returns:
             Path to created file or None if failed
         """
-        try:
-            timestamp = datetime.now()
+        return self.create_action_files([message])[0]
 
-            # Generate filename
-            safe_sender = "".join(c for c in message.sender[:20] if c.isalnum() or c in ' -_').strip()
-            safe_sender = safe_sender.replace(' ', '_') or 'unknown'
-            filename = f"WHATSAPP_{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_sender}.md"
-            filepath = self.output_path / filename
-
-            # Generate suggested actions
-            suggested_actions = self._generate_suggested_actions(message)
-
-            # Create markdown content
-            content = f"""---
-type: whatsapp
-message_id: {message.message_id}
-sender: {message.sender}
-sender_number: {message.sender_number}
-is_group: {message.is_group}
-group_name: {message.group_name}
-timestamp: {message.timestamp}
-detected_at: {timestamp.isoformat()}
-priority: {message.priority}
-has_media: {message.has_media}
-status: pending
----
-
-# WhatsApp Message from {message.sender}
-
-## Message Details
-- **From:** {message.sender}
-- **Time:** {message.timestamp}
-- **Priority:** {message.priority.upper()}
-- **Type:** {'Group Chat' if message.is_group else 'Direct Message'}
-{f'- **Group:** {message.group_name}' if message.is_group else ''}
-- **Has Media:** {'Yes' if message.has_media else 'No'}
-
-## Message Content
-{message.content}
+    def create_action_files(self, messages: List[WhatsAppMessage]) -> List[Optional[Path]]:
+        """
+        Create action files for a batch of messages from one poll.
 
-## Suggested Actions
-{suggested_actions}
+        The needs_action folder is opened once and every file is created
+        relative to it, so a burst of messages costs one path lookup
+        rather than one per file.
 
-## Processing Notes
-- [ ] Review message content
-- [ ] Determine appropriate response
-- [ ] Move to /Approved when ready to act
+        Args:
+            messages: WhatsAppMessage objects
 
----
-*Detected by WhatsApp Watcher at {timestamp.strftime('%Y-%m-%d %H:%M:%S')}*
-*AI Employee Zoya - Automated Message Processing*
-"""
+        Returns:
+            Path to each created file, or None where creation failed
+        """
+        timestamp = datetime.now()
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+        results: List[Optional[Path]] = []
 
-            # Write the file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+        dir_fd = None
+        if os.open in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(self.output_path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            except OSError as e:
+                logger.debug(f"Could not open {self.output_path}: {e}")
 
-            logger.info(f"Created WhatsApp action file: {filename}")
-            return filepath
+        try:
+            for message in messages:
+                try:
+                    filename, data = self._render_action_file(message, timestamp)
+
+                    # Messages from one sender can share a second, in this
+                    # batch or an earlier poll; never overwrite, bump a suffix
+                    stem, n = filename[:-3], 1
+                    while True:
+                        try:
+                            if dir_fd is not None:
+                                fd = os.open(filename, flags, 0o644, dir_fd=dir_fd)
+                            else:
+                                fd = os.open(self.output_path / filename, flags, 0o644)
+                            break
+                        except FileExistsError:
+                            n += 1
+                            filename = f"{stem}_{n}.md"
+
+                    # Write without a text-IO wrapper, retrying short writes
+                    try:
+                        view = memoryview(data)
+                        while view:
+                            view = view[os.write(fd, view):]
+                    finally:
+                        os.close(fd)
+
+                    logger.info(f"Created WhatsApp action file: {filename}")
+                    results.append(self.output_path / filename)
 
-        except Exception as e:
-            logger.error(f"Failed to create action file: {e}")
-            return None
+                except Exception as e:
+                    logger.error(f"Failed to create action file: {e}")
+                    results.append(None)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        return results
+
+    def _render_action_file(self, message: WhatsAppMessage, timestamp: datetime) -> Tuple[str, bytes]:
+        """Return the filename and encoded markdown for a message's action file."""
+        # Generate filename
+        safe_sender = "".join(c for c in message.sender[:20] if c.isalnum() or c in ' -_').strip()
+        safe_sender = safe_sender.replace(' ', '_') or 'unknown'
+        filename = f"WHATSAPP_{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_sender}.md"
+
+        # Generate suggested actions
+        suggested_actions = self._generate_suggested_actions(message)
+
+        # Create markdown content
+        content = _ACTION_FILE_TEMPLATE.substitute(
+            message_id=message.message_id,
+            sender=message.sender,
+            sender_number=message.sender_number,
+            is_group=message.is_group,
+            group_name=message.group_name,
+            timestamp=message.timestamp,
+            detected_at=timestamp.isoformat(),
+            priority=message.priority,
+            has_media=message.has_media,
+            priority_upper=message.priority.upper(),
+            chat_type='Group Chat' if message.is_group else 'Direct Message',
+            group_line=f'- **Group:** {message.group_name}' if message.is_group else '',
+            media_label='Yes' if message.has_media else 'No',
+            content=message.content,
+            suggested_actions=suggested_actions,
+            detected_at_display=timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        )
+        return filename, content.encode('utf-8')
 
     def _generate_suggested_actions(self, message: WhatsAppMessage) -> str:
         """Generate suggested actions based on message content."""
         actions = []
-        content_lower = message.content.lower()
+        counts = self.KEYWORDS.count(message.content)
 
         # Check for specific patterns
-        if any(kw in content_lower for kw in ['invoice', 'payment', 'pay', 'price', 'cost', 'quote']):
-            actions.append("- [ ] Review payment/pricing details")
-            actions.append("- [ ] Prepare invoice or quote if needed")
-
-        if any(kw in content_lower for kw in ['meeting', 'schedule', 'call', 'appointment', 'available']):
-            actions.append("- [ ] Check calendar availability")
-            actions.append("- [ ] Schedule meeting or call")
-
-        if any(kw in content_lower for kw in ['deadline', 'due', 'urgent', 'asap']):
-            actions.append("- [ ] Prioritize this request")
-            actions.append("- [ ] Assess timeline and resources")
-
-        if any(kw in content_lower for kw in ['help', 'support', 'issue', 'problem', 'error']):
-            actions.append("- [ ] Investigate the issue")
-            actions.append("- [ ] Provide support/assistance")
-
-        if any(kw in content_lower for kw in ['order', 'delivery', 'shipping', 'tracking']):
-            actions.append("- [ ] Check order status")
-            actions.append("- [ ] Provide tracking/delivery information")
-
-        if any(kw in content_lower for kw in ['project', 'proposal', 'contract']):
-            actions.append("- [ ] Review project requirements")
-            actions.append("- [ ] Prepare necessary documentation")
+        for bucket, steps in self.ACTION_STEPS:
+            if counts[bucket]:
+                actions.extend(steps)
 
         if message.has_media:
             actions.append("- [ ] Review attached media")
@@ -594,54 +995,68 @@ status: pending
             logger.warning("WhatsApp watcher is already running")
             return
 
+        # Browser setup and authentication block this caller; monitoring
+        # then continues on the loop thread
+        self._loop_thread = get_loop_thread()
+        try:
+            started = self._loop_thread.submit(self._start()).result()
+        except Exception as e:
+            logger.error(f"Failed to start WhatsApp monitoring: {e}")
+            return
+        if not started:
+            return
+
+        self.is_running = True
+        self._monitor_future = self._loop_thread.submit(self._monitoring_loop())
+
+        logger.info(f"Started WhatsApp monitoring (checking every {self.check_interval}s)")
+
+    async def _start(self) -> bool:
+        """Open the browser, load WhatsApp Web and wait for authentication."""
+        self._stop_event = asyncio.Event()
+
         # Initialize browser
-        if not self._initialize_browser():
+        if not await self._initialize_browser():
             logger.error("Failed to initialize browser")
-            return
+            return False
 
         # Navigate to WhatsApp Web
-        if not self._navigate_to_whatsapp():
+        if not await self._navigate_to_whatsapp():
             logger.error("Failed to navigate to WhatsApp Web")
-            return
+            return False
 
         # Wait for authentication
-        if not self._wait_for_authentication():
+        if not await self._wait_for_authentication():
             logger.error("WhatsApp authentication failed")
-            return
-
-        self.is_running = True
-        self._stop_event.clear()
-
-        # Start monitoring in a separate thread
-        self._monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self._monitor_thread.start()
+            return False
 
-        logger.info(f"Started WhatsApp monitoring (checking every {self.check_interval}s)")
+        return True
 
-    def _monitoring_loop(self) -> None:
-        """Main monitoring loop running in a separate thread."""
+    async def _monitoring_loop(self) -> None:
+        """Main monitoring loop running on the shared event loop."""
         logger.info("WhatsApp monitoring loop started")
 
         while not self._stop_event.is_set():
             try:
+                await self._check_dom_health()
+
                 # Check for new messages
-                new_messages = self.check_for_updates()
+                new_messages = await self.check_for_updates()
 
-                for message in new_messages:
-                    if self._stop_event.is_set():
-                        break
+                # Only process medium and high priority by default
+                # (can be changed to process all)
+                actionable = [m for m in new_messages if m.priority in ['high', 'medium']]
+                filepaths = self.create_action_files(actionable)
 
-                    # Only process medium and high priority by default
-                    # (can be changed to process all)
-                    if message.priority in ['high', 'medium']:
-                        filepath = self.create_action_file(message)
+                for message, filepath in zip(actionable, filepaths):
+                    if filepath:
+                        self._remember_id(message.message_id)
+                        self.handle_new_file(str(filepath))
 
-                        if filepath:
-                            self.processed_ids.add(message.message_id)
-                            self.handle_new_file(str(filepath))
-                    else:
+                for message in new_messages:
+                    if message.priority not in ['high', 'medium']:
                         # Still mark as processed to avoid reprocessing
-                        self.processed_ids.add(message.message_id)
+                        self._remember_id(message.message_id)
 
                 # Save processed IDs periodically
                 if new_messages:
@@ -650,30 +1065,69 @@ status: pending
             except Exception as e:
                 logger.error(f"Error in WhatsApp monitoring loop: {e}")
 
-            # Wait for next check interval
-            self._stop_event.wait(self.check_interval)
+            # Wait for new unread messages or the next check interval
+            await self._wait_for_activity()
 
         logger.info("WhatsApp monitoring loop stopped")
 
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep without blocking the loop, waking early if stop is requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=max(seconds, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    async def _wait_for_activity(self) -> None:
+        """
+        Wait until the unread badges change, check_interval elapses or stop is requested.
+
+        The browser watches the badges itself, so a new message wakes the
+        loop within about a second instead of waiting out the full interval.
+        The wait runs in short slices so stop_monitoring is never held up.
+        """
+        deadline = time.monotonic() + self.check_interval
+        try:
+            before = await self.page.evaluate(_UNREAD_SIGNATURE_JS, self.SELECTORS['unread_chat'])
+        except Exception as e:
+            logger.debug(f"Unread badge watch unavailable: {e}")
+            await self._sleep(self.check_interval)
+            return
+
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await self.page.wait_for_function(
+                    _UNREAD_CHANGED_JS,
+                    arg=[self.SELECTORS['unread_chat'], before],
+                    polling=500,
+                    timeout=min(remaining, 1.0) * 1000
+                )
+                return
+            except PlaywrightTimeoutError:
+                continue
+            except Exception as e:
+                logger.debug(f"Unread badge watch failed: {e}")
+                await self._sleep(remaining)
+                return
+
     def stop_monitoring(self) -> None:
         """Stop the WhatsApp monitoring process."""
         if not self.is_running:
             return
 
         logger.info("Stopping WhatsApp monitoring...")
-        self._stop_event.set()
-
-        if self._monitor_thread and self._monitor_thread.is_alive():
-            self._monitor_thread.join(timeout=10)
+        self._loop_thread.loop.call_soon_threadsafe(self._stop_event.set)
 
-        # Close browser
         try:
-            if self.context:
-                self.context.close()
-            if self.playwright:
-                self.playwright.stop()
+            if self._monitor_future:
+                self._monitor_future.result(timeout=10)
+
+            # Close our page; the browser context stays warm in the pool
+            self._loop_thread.submit(self._close_page()).result(timeout=10)
         except Exception as e:
-            logger.warning(f"Error closing browser: {e}")
+            logger.warning(f"Error stopping WhatsApp monitoring: {e}")
 
         self.is_running = False
         self.is_authenticated = False
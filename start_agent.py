@@ -1,8 +1,13 @@
 import os
 import sys
 import time
+import queue
+import atexit
+import importlib
 import signal
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 from skills.filesystem_watcher import FilesystemWatcher
@@ -10,37 +15,42 @@ from skills.task_processor import TaskProcessorMonitor
 from skills.execution_engine import ExecutionMonitor
 from skills.health_monitor import HealthMonitor
 from skills.persistence_loop import PersistenceLoop
+from skills.async_loop import get_loop_thread
+from skills.error_handler import ErrorHandler
 
-# Optional Gmail watcher - graceful handling if not configured
-try:
-    from skills.gmail_watcher import GmailWatcher
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
-
-# Optional WhatsApp watcher - graceful handling if not configured
-try:
-    from skills.whatsapp_watcher import WhatsAppWatcher
-    WHATSAPP_AVAILABLE = True
-except ImportError:
-    WHATSAPP_AVAILABLE = False
-
-# Optional Odoo watcher - graceful handling if not configured
-try:
-    from skills.odoo_watcher import OdooWatcher
-    ODOO_AVAILABLE = True
-except ImportError:
-    ODOO_AVAILABLE = False
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/start_agent.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+def _load_optional_watcher(module_name: str, class_name: str):
+    """
+    Import an optional watcher class on demand.
+
+    Gmail, WhatsApp and Odoo pull in heavy client libraries, so they are only
+    imported once their credentials are known to exist. Returns None if the
+    module's dependencies are not installed.
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return getattr(module, class_name)
+
+
+# Set up logging: callers only enqueue records, and a QueueListener thread
+# formats and writes them to the log file and stdout
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('logs/start_agent.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_records: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_listener = QueueListener(_log_records, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(QueueHandler(_log_records))
 logger = logging.getLogger(__name__)
 
 class AgentOrchestrator:
@@ -57,6 +67,8 @@ class AgentOrchestrator:
     - HealthMonitor: Monitors system health
     """
 
+    _dirs_ready = False  # Vault directories created by the first initialize_components
+
     def __init__(self):
         self.watcher = None
         self.gmail_watcher = None
@@ -65,10 +77,14 @@ class AgentOrchestrator:
         self.task_processor = None
         self.execution_monitor = None
         self.health_monitor = None
+        self._health_future = None  # run_async() running on the shared event loop
         self.persistence_loop = None  # Ralph Wiggum Loop
         self.running = False
+        self._stop_event = threading.Event()
         self.restart_count = 0
         self.max_restarts = 10  # Prevent infinite restart loops
+        self.stable_uptime = 300  # Seconds of uptime after which a crash no longer counts against the budget
+        self.restart_backoff = ErrorHandler(base_delay=5.0, max_delay=60.0)
         self.gmail_enabled = False
         self.whatsapp_enabled = False
         self.odoo_enabled = False
@@ -83,19 +99,26 @@ class AgentOrchestrator:
             approved_path = "obsidian_vault/Approved"
             done_path = "obsidian_vault/Done"
 
-            # Ensure all directories exist
-            for path in [inbox_path, needs_action_path, plans_path, approved_path, done_path]:
-                os.makedirs(path, exist_ok=True)
+            # Ensure all directories exist (once per process, not on every restart)
+            if not AgentOrchestrator._dirs_ready:
+                for path in [inbox_path, needs_action_path, plans_path, approved_path, done_path]:
+                    # One stat in the usual case; makedirs walks every path component
+                    if not os.path.isdir(path):
+                        os.makedirs(path, exist_ok=True)
+                AgentOrchestrator._dirs_ready = True
 
             # Create the filesystem watcher instance for inbox
             self.watcher = FilesystemWatcher(inbox_path, needs_action_path)
 
-            # Initialize Gmail watcher if available and configured
-            if GMAIL_AVAILABLE:
-                gmail_creds = Path("credentials/gmail_credentials.json")
-                gmail_token = Path("credentials/gmail_token.json")
+            # Initialize Gmail watcher if configured and available
+            gmail_creds = Path("credentials/gmail_credentials.json")
+            gmail_token = Path("credentials/gmail_token.json")
 
-                if gmail_creds.exists() or gmail_token.exists():
+            if gmail_creds.exists() or gmail_token.exists():
+                GmailWatcher = _load_optional_watcher("skills.gmail_watcher", "GmailWatcher")
+                if GmailWatcher is None:
+                    logger.info("Gmail watcher not available - install google-api-python-client")
+                else:
                     try:
                         self.gmail_watcher = GmailWatcher(
                             output_path=needs_action_path,
@@ -109,17 +132,18 @@ class AgentOrchestrator:
                     except Exception as e:
                         logger.warning(f"Gmail watcher initialization failed: {e}")
                         logger.info("Continuing without Gmail monitoring")
-                else:
-                    logger.info("Gmail credentials not found - Gmail monitoring disabled")
-                    logger.info("Run 'python setup_gmail.py' to configure Gmail integration")
             else:
-                logger.info("Gmail watcher not available - install google-api-python-client")
+                logger.info("Gmail credentials not found - Gmail monitoring disabled")
+                logger.info("Run 'python setup_gmail.py' to configure Gmail integration")
 
-            # Initialize WhatsApp watcher if available and configured
-            if WHATSAPP_AVAILABLE:
-                whatsapp_session = Path("credentials/whatsapp_session")
+            # Initialize WhatsApp watcher if configured and available
+            whatsapp_session = Path("credentials/whatsapp_session")
 
-                if whatsapp_session.exists() and any(whatsapp_session.iterdir()):
+            if whatsapp_session.exists() and any(whatsapp_session.iterdir()):
+                WhatsAppWatcher = _load_optional_watcher("skills.whatsapp_watcher", "WhatsAppWatcher")
+                if WhatsAppWatcher is None:
+                    logger.info("WhatsApp watcher not available - install playwright")
+                else:
                     try:
                         self.whatsapp_watcher = WhatsAppWatcher(
                             output_path=needs_action_path,
@@ -133,16 +157,17 @@ class AgentOrchestrator:
                     except Exception as e:
                         logger.warning(f"WhatsApp watcher initialization failed: {e}")
                         logger.info("Continuing without WhatsApp monitoring")
-                else:
-                    logger.info("WhatsApp session not found - WhatsApp monitoring disabled")
-                    logger.info("Run 'python setup_whatsapp.py' to configure WhatsApp integration")
             else:
-                logger.info("WhatsApp watcher not available - install playwright")
-
-            # Initialize Odoo watcher if available and configured
-            if ODOO_AVAILABLE:
-                odoo_url = os.getenv('ODOO_URL')
-                if odoo_url:
+                logger.info("WhatsApp session not found - WhatsApp monitoring disabled")
+                logger.info("Run 'python setup_whatsapp.py' to configure WhatsApp integration")
+
+            # Initialize Odoo watcher if configured and available
+            odoo_url = os.getenv('ODOO_URL')
+            if odoo_url:
+                OdooWatcher = _load_optional_watcher("skills.odoo_watcher", "OdooWatcher")
+                if OdooWatcher is None:
+                    logger.info("Odoo watcher not available")
+                else:
                     try:
                         self.odoo_watcher = OdooWatcher(
                             vault_path="obsidian_vault",
@@ -153,11 +178,9 @@ class AgentOrchestrator:
                     except Exception as e:
                         logger.warning(f"Odoo watcher initialization failed: {e}")
                         logger.info("Continuing without Odoo integration")
-                else:
-                    logger.info("Odoo not configured - Odoo integration disabled")
-                    logger.info("Run 'python setup_odoo.py' to configure Odoo integration")
             else:
-                logger.info("Odoo watcher not available")
+                logger.info("Odoo not configured - Odoo integration disabled")
+                logger.info("Run 'python setup_odoo.py' to configure Odoo integration")
 
             # Create the task processor monitor
             self.task_processor = TaskProcessorMonitor(needs_action_path, plans_path)
@@ -224,25 +247,22 @@ class AgentOrchestrator:
             self.execution_monitor.start_monitoring()
 
             # Log startup summary
-            components = ["filesystem_watcher", "task_processor", "execution_monitor", "persistence_loop"]
-            if self.gmail_enabled:
-                components.append("gmail_watcher")
-            if self.whatsapp_enabled:
-                components.append("whatsapp_watcher")
-            if self.odoo_enabled:
-                components.append("odoo_watcher")
+            optional = (("gmail_watcher", self.gmail_enabled),
+                        ("whatsapp_watcher", self.whatsapp_enabled),
+                        ("odoo_watcher", self.odoo_enabled))
+            components = ("filesystem_watcher", "task_processor", "execution_monitor", "persistence_loop",
+                          *(name for name, enabled in optional if enabled))
             logger.info(f"AI Employee Zoya started with components: {', '.join(components)}")
             logger.info("Now monitoring inbox, processing tasks, and executing approved plans...")
 
             # Log persistence loop status
             if self.persistence_loop:
                 status = self.persistence_loop.get_status()
-                logger.info(f"Ralph Wiggum Loop monitoring: Plans={status['plans_pending']}, Approved={status['approved_pending']}, Odoo={status['odoo_pending']}")
+                logger.info(f"Ralph Wiggum Loop monitoring: Plans={status.plans_pending}, Approved={status.approved_pending}, Odoo={status.odoo_pending}")
 
-            # Start health monitoring in a separate thread
-            import threading
-            health_thread = threading.Thread(target=self.health_monitor.start_monitoring, daemon=True)
-            health_thread.start()
+            # Run health monitoring as a coroutine on the shared event loop (alongside WhatsApp)
+            self._health_future = get_loop_thread().submit(self.health_monitor.run_async())
+            self._health_future.add_done_callback(self._on_health_monitor_done)
             logger.info("Health monitoring started")
 
             return True
@@ -268,6 +288,9 @@ class AgentOrchestrator:
                 self.execution_monitor.stop_monitoring()
             if self.health_monitor:
                 self.health_monitor.stop_monitoring()
+            if self._health_future:
+                self._health_future.cancel()
+                self._health_future = None
             if self.persistence_loop:
                 self.persistence_loop.stop()
                 logger.info("Ralph Wiggum persistence loop stopped")
@@ -280,12 +303,14 @@ class AgentOrchestrator:
     def run(self):
         """Main run loop with error handling and auto-restart"""
         self.running = True
+        self._stop_event.clear()
         
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
         
         while self.running and self.restart_count < self.max_restarts:
+            last_start = time.monotonic()
             try:
                 logger.info(f"Starting AI Employee Zoya (restart #{self.restart_count})...")
                 
@@ -299,20 +324,15 @@ class AgentOrchestrator:
                 
                 logger.info("AI Employee Zoya is running in Background Mode with auto-restart enabled...")
 
-                # Main loop - keep running until stopped
-                status_interval = 60  # Log status every 60 seconds
-                seconds_since_status = 0
-
-                while self.running:
-                    time.sleep(1)
-                    seconds_since_status += 1
+                # Main loop - sleep until stopped, waking every 60 seconds to log status
+                status_interval = 60
 
+                while not self._stop_event.wait(timeout=status_interval):
                     # Periodically log persistence loop status
-                    if seconds_since_status >= status_interval and self.persistence_loop:
+                    if self.persistence_loop:
                         status = self.persistence_loop.get_status()
-                        if status['total_pending'] > 0:
-                            logger.info(f"[Ralph Wiggum] Pending work: Plans={status['plans_pending']}, Approved={status['approved_pending']}, Odoo={status['odoo_pending']}")
-                        seconds_since_status = 0
+                        if status.total_pending > 0:
+                            logger.info(f"[Ralph Wiggum] Pending work: Plans={status.plans_pending}, Approved={status.approved_pending}, Odoo={status.odoo_pending}")
 
                 break  # Exit loop if self.running becomes False
                 
@@ -320,6 +340,9 @@ class AgentOrchestrator:
                 logger.info("Received keyboard interrupt")
                 break
             except Exception as e:
+                # A crash after a long healthy run is a fresh fault, not part of a restart storm
+                if time.monotonic() - last_start > self.stable_uptime:
+                    self.restart_count = 0
                 self.restart_count += 1
                 logger.error(f"Agent crashed with error: {str(e)}")
                 logger.info(f"Restarting agent... (attempt {self.restart_count}/{self.max_restarts})")
@@ -330,16 +353,26 @@ class AgentOrchestrator:
                 except:
                     pass  # Ignore errors during cleanup
                 
-                time.sleep(5)  # Wait before restart
+                # Back off exponentially (with jitter) so a flapping dependency doesn't burn the budget
+                delay = self.restart_backoff.calculate_delay(self.restart_count - 1)
+                logger.info(f"Waiting {delay:.1f}s before restart")
+                self._stop_event.wait(timeout=delay)
         
         # Final cleanup
         self.stop_components()
         logger.info("AI Employee Zoya stopped")
     
+    @staticmethod
+    def _on_health_monitor_done(future):
+        """Log a health monitor that died with an exception instead of losing it silently"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Health monitor stopped with error: {future.exception()!r}")
+
     def _signal_handler(self, signum, frame):
         """Handle termination signals"""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        self._stop_event.set()
 
 
 def main():
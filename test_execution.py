@@ -9,9 +9,9 @@ done_path = "obsidian_vault/Done"
 engine = ExecutionEngine(approved_path, done_path)
 
 # Find and execute any plan in the approved folder
-approved_files = [f for f in os.listdir(approved_path) if f.endswith('.md')]
-if approved_files:
-    plan_file = os.path.join(approved_path, approved_files[0])
+with os.scandir(approved_path) as entries:
+    plan_file = next((e.path for e in entries if e.name.endswith('.md')), None)
+if plan_file:
     print(f"Found plan file: {plan_file}")
     engine.execute_plan(plan_file)
     print("Plan executed successfully!")
@@ -0,0 +1,99 @@
+"""Tests for skills.jsonl_log."""
+
+import json
+import random
+from collections import deque
+
+import pytest
+
+from skills import jsonl_log
+from skills.jsonl_log import read_jsonl_tail
+
+
+def read_jsonl_tail_forward(path, limit):
+    """The original forward-scanning reader, kept as the reference."""
+    if limit <= 0:
+        return []
+    with open(path, 'rb') as f:
+        lines = deque(f, maxlen=limit)
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue
+    return entries
+
+
+def write_lines(path, lines, trailing_newline=True):
+    data = "\n".join(lines)
+    if trailing_newline and lines:
+        data += "\n"
+    path.write_bytes(data.encode('utf-8'))
+
+
+def entries(n):
+    return [json.dumps({"id": i, "pad": "x" * (i % 7)}) for i in range(n)]
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(jsonl_log, "TAIL_BLOCK_SIZE", 16)
+
+
+def test_missing_file_returns_empty(tmp_path):
+    assert read_jsonl_tail(tmp_path / "missing.jsonl", 5) == []
+
+
+def test_empty_file_and_nonpositive_limit(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(b"")
+    assert read_jsonl_tail(path, 5) == []
+
+    write_lines(path, entries(3))
+    assert read_jsonl_tail(path, 0) == []
+    assert read_jsonl_tail(path, -1) == []
+
+
+def test_limit_larger_than_file(tmp_path, small_blocks):
+    path = tmp_path / "log.jsonl"
+    write_lines(path, entries(4))
+    assert [e["id"] for e in read_jsonl_tail(path, 100)] == [0, 1, 2, 3]
+
+
+def test_no_trailing_newline(tmp_path, small_blocks):
+    path = tmp_path / "log.jsonl"
+    write_lines(path, entries(10), trailing_newline=False)
+    assert [e["id"] for e in read_jsonl_tail(path, 3)] == [7, 8, 9]
+    assert [e["id"] for e in read_jsonl_tail(path, 10)] == list(range(10))
+
+
+def test_bad_lines_are_skipped(tmp_path):
+    path = tmp_path / "log.jsonl"
+    write_lines(path, ['{"id": 0}', 'not json', '', '{"id": 1}'])
+    assert read_jsonl_tail(path, 4) == [{"id": 0}, {"id": 1}]
+    assert read_jsonl_tail(path, 2) == [{"id": 1}]
+
+
+def test_line_ending_exactly_on_block_boundary(tmp_path, monkeypatch):
+    path = tmp_path / "log.jsonl"
+    line = '{"id": 12345}'  # 13 bytes, 14 with the newline
+    write_lines(path, [line] * 6)
+    for block_size in (7, 13, 14, 15, 28):
+        monkeypatch.setattr(jsonl_log, "TAIL_BLOCK_SIZE", block_size)
+        for limit in range(1, 8):
+            assert read_jsonl_tail(path, limit) == read_jsonl_tail_forward(path, limit)
+
+
+def test_matches_forward_reader(tmp_path, monkeypatch):
+    rng = random.Random(1234)
+    path = tmp_path / "log.jsonl"
+    for _ in range(200):
+        lines = [
+            json.dumps({"id": i, "text": "y" * rng.randrange(0, 40)})
+            for i in range(rng.randrange(0, 30))
+        ]
+        write_lines(path, lines, trailing_newline=rng.random() < 0.8)
+        monkeypatch.setattr(jsonl_log, "TAIL_BLOCK_SIZE", rng.choice([1, 2, 5, 16, 64, 4096]))
+        limit = rng.randrange(1, 35)
+        assert read_jsonl_tail(path, limit) == read_jsonl_tail_forward(path, limit)
@@ -0,0 +1,382 @@
+"""Tests for skills.whatsapp_watcher (no browser required)."""
+
+import asyncio
+import os
+import random
+
+import pytest
+
+from skills import whatsapp_watcher
+from skills.whatsapp_watcher import WhatsAppMessage, WhatsAppWatcher
+
+RING_FILE = "logs/whatsapp_processed_ids.bin"
+
+
+def make_message(n, sender="Bob", content="Please send the invoice", has_media=False):
+    return WhatsAppMessage(
+        message_id=f"wa_{n:016x}",
+        sender=sender,
+        sender_number="",
+        content=content,
+        timestamp="10:00",
+        is_group=False,
+        group_name="",
+        has_media=has_media,
+        priority="medium",
+    )
+
+
+def msg_id(n):
+    return f"wa_{n + 1:016x}"
+
+
+def open_watcher(slots=None, monkeypatch=None):
+    if slots is not None:
+        monkeypatch.setattr(WhatsAppWatcher, "MAX_PROCESSED_IDS", slots)
+    return WhatsAppWatcher("needs_action", session_path="session")
+
+
+def close_watcher(w):
+    w._save_processed_ids()
+    if w._ring is not None:
+        w._ring.close()
+
+
+@pytest.fixture
+def watcher(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    w = open_watcher()
+    yield w
+    close_watcher(w)
+
+
+def reload_ids(slots, monkeypatch):
+    w = open_watcher(slots, monkeypatch)
+    ids = list(w.processed_ids)
+    close_watcher(w)
+    return ids
+
+
+def test_ring_persists_ids_across_restarts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    w = open_watcher(8, monkeypatch)
+    for n in range(5):
+        w._remember_id(msg_id(n))
+    close_watcher(w)
+
+    assert reload_ids(8, monkeypatch) == [msg_id(n) for n in range(5)]
+
+
+def test_ring_wraps_around_keeping_newest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    w = open_watcher(8, monkeypatch)
+    for n in range(19):
+        w._remember_id(msg_id(n))
+    assert list(w.processed_ids) == [msg_id(n) for n in range(11, 19)]
+    close_watcher(w)
+
+    assert reload_ids(8, monkeypatch) == [msg_id(n) for n in range(11, 19)]
+
+    # Appends after a reload continue from the saved head
+    w = open_watcher(8, monkeypatch)
+    w._remember_id(msg_id(19))
+    close_watcher(w)
+    assert reload_ids(8, monkeypatch) == [msg_id(n) for n in range(12, 20)]
+
+
+@pytest.mark.parametrize("new_slots, kept", [(4, range(6, 10)), (16, range(2, 10))])
+def test_ring_resize_keeps_newest_ids(tmp_path, monkeypatch, new_slots, kept):
+    monkeypatch.chdir(tmp_path)
+    w = open_watcher(8, monkeypatch)
+    for n in range(10):
+        w._remember_id(msg_id(n))
+    close_watcher(w)
+
+    expected = [msg_id(n) for n in kept]
+    assert reload_ids(new_slots, monkeypatch) == expected
+    assert os.path.getsize(RING_FILE) == (
+        whatsapp_watcher._RING_HEADER.size + new_slots * whatsapp_watcher._DIGEST_SIZE
+    )
+    # The re-laid ring is itself a valid file
+    assert reload_ids(new_slots, monkeypatch) == expected
+
+
+def corrupt_truncated(data):
+    return data[:-3]
+
+
+def corrupt_slot_boundary(data):
+    return data[:-whatsapp_watcher._DIGEST_SIZE]
+
+
+def corrupt_header(data):
+    return b"\xff" * whatsapp_watcher._RING_HEADER.size + data[whatsapp_watcher._RING_HEADER.size:]
+
+
+def corrupt_short(data):
+    return data[:2]
+
+
+@pytest.mark.parametrize("corrupt", [
+    corrupt_truncated, corrupt_slot_boundary, corrupt_header, corrupt_short,
+])
+def test_ring_recovers_from_corrupt_file(tmp_path, monkeypatch, corrupt):
+    monkeypatch.chdir(tmp_path)
+    w = open_watcher(8, monkeypatch)
+    for n in range(5):
+        w._remember_id(msg_id(n))
+    close_watcher(w)
+
+    with open(RING_FILE, "rb") as f:
+        data = f.read()
+    with open(RING_FILE, "wb") as f:
+        f.write(corrupt(data))
+
+    w = open_watcher(8, monkeypatch)
+    assert list(w.processed_ids) == []
+    assert w._ring is not None
+
+    # The ring is usable again straight away
+    w._remember_id(msg_id(7))
+    close_watcher(w)
+    assert reload_ids(8, monkeypatch) == [msg_id(7)]
+
+
+def test_action_files_never_overwrite_across_polls(watcher):
+    first = watcher.create_action_files([make_message(1), make_message(2)])
+    second = watcher.create_action_files([make_message(3)])
+
+    paths = first + second
+    assert None not in paths
+    assert len(set(paths)) == 3
+    for n, path in enumerate(paths, 1):
+        assert f"message_id: wa_{n:016x}" in path.read_text(encoding="utf-8")
+
+    stem = paths[0].name[:-3]
+    if paths[2].name.startswith(stem):
+        assert [p.name for p in paths] == [f"{stem}.md", f"{stem}_2.md", f"{stem}_3.md"]
+
+
+def test_action_file_survives_short_writes(watcher, monkeypatch):
+    real_write = os.write
+    with monkeypatch.context() as m:
+        m.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:7])))
+        path = watcher.create_action_file(make_message(1, content="x" * 500))
+
+    text = path.read_text(encoding="utf-8")
+    assert "x" * 500 in text
+    assert text.endswith("*AI Employee Zoya - Automated Message Processing*\n")
+
+
+# --- Keyword matching: the original per-call scans, kept as the reference ---
+
+ORIGINAL_ACTION_PATTERNS = [
+    (['invoice', 'payment', 'pay', 'price', 'cost', 'quote'],
+     ["- [ ] Review payment/pricing details", "- [ ] Prepare invoice or quote if needed"]),
+    (['meeting', 'schedule', 'call', 'appointment', 'available'],
+     ["- [ ] Check calendar availability", "- [ ] Schedule meeting or call"]),
+    (['deadline', 'due', 'urgent', 'asap'],
+     ["- [ ] Prioritize this request", "- [ ] Assess timeline and resources"]),
+    (['help', 'support', 'issue', 'problem', 'error'],
+     ["- [ ] Investigate the issue", "- [ ] Provide support/assistance"]),
+    (['order', 'delivery', 'shipping', 'tracking'],
+     ["- [ ] Check order status", "- [ ] Provide tracking/delivery information"]),
+    (['project', 'proposal', 'contract'],
+     ["- [ ] Review project requirements", "- [ ] Prepare necessary documentation"]),
+]
+
+
+def original_priority(content, sender, urgent_keywords, business_keywords, vip_contacts):
+    content_lower = content.lower()
+    is_vip = any(vip.lower() in sender.lower() for vip in vip_contacts)
+    urgent_count = sum(1 for kw in urgent_keywords if kw in content_lower)
+    business_count = sum(1 for kw in business_keywords if kw in content_lower)
+    if urgent_count >= 2 or is_vip:
+        return 'high'
+    elif urgent_count >= 1 or business_count >= 2:
+        return 'medium'
+    return 'low'
+
+
+def original_actions(content, has_media):
+    actions = []
+    content_lower = content.lower()
+    for keywords, steps in ORIGINAL_ACTION_PATTERNS:
+        if any(kw in content_lower for kw in keywords):
+            actions.extend(steps)
+    if has_media:
+        actions.append("- [ ] Review attached media")
+    if not actions:
+        actions.append("- [ ] Read and assess message importance")
+        actions.append("- [ ] Determine if response needed")
+    actions.append("- [ ] Reply to sender (requires HITL approval)")
+    actions.append("- [ ] Archive after processing")
+    return '\n'.join(actions)
+
+
+def random_messages(count, seed=2024):
+    rng = random.Random(seed)
+    vocabulary = sorted({
+        kw for keywords, _ in ORIGINAL_ACTION_PATTERNS for kw in keywords
+    } | set(WhatsAppWatcher.URGENT_KEYWORDS) | set(WhatsAppWatcher.BUSINESS_KEYWORDS))
+    filler = ['hello', 'thanks', 'ok', 'see you', 'caf\u00e9', '\u0130stanbul', '\U0001f44d', 'x']
+    senders = ['Alice', 'Bob Smith', 'ACME Corp', '+1 555 0100', 'boss']
+
+    for _ in range(count):
+        words = [
+            rng.choice(vocabulary) if rng.random() < 0.4 else rng.choice(filler)
+            for _ in range(rng.randrange(0, 12))
+        ]
+        words = [w.upper() if rng.random() < 0.2 else w for w in words]
+        # Glue some words together so keywords also appear inside other words
+        content = ''.join(w + rng.choice([' ', ' ', '', '. ']) for w in words)
+        yield content, rng.choice(senders), rng.random() < 0.2
+
+
+@pytest.fixture(params=["hyperscan", "python"])
+def keyword_watcher(request, watcher, monkeypatch):
+    if request.param == "hyperscan":
+        if not whatsapp_watcher.HYPERSCAN_AVAILABLE:
+            pytest.skip("hyperscan not installed")
+    else:
+        monkeypatch.setattr(whatsapp_watcher, "HYPERSCAN_AVAILABLE", False)
+        matcher = whatsapp_watcher.KeywordMatcher({
+            'urgent': WhatsAppWatcher.URGENT_KEYWORDS,
+            'business': WhatsAppWatcher.BUSINESS_KEYWORDS,
+            **WhatsAppWatcher.ACTION_KEYWORDS,
+        })
+        monkeypatch.setattr(WhatsAppWatcher, "KEYWORDS", matcher)
+    return watcher
+
+
+@pytest.mark.parametrize("vip_contacts", [[], ['boss', 'ACME']])
+def test_priority_matches_original(keyword_watcher, monkeypatch, vip_contacts):
+    monkeypatch.setattr(WhatsAppWatcher, "VIP_CONTACTS", vip_contacts)
+    for content, sender, _ in random_messages(5000):
+        assert keyword_watcher._determine_priority(content, sender) == original_priority(
+            content, sender,
+            WhatsAppWatcher.URGENT_KEYWORDS, WhatsAppWatcher.BUSINESS_KEYWORDS, vip_contacts
+        ), content
+
+
+def test_suggested_actions_match_original(keyword_watcher):
+    for n, (content, sender, has_media) in enumerate(random_messages(5000)):
+        message = make_message(n, sender=sender, content=content, has_media=has_media)
+        assert keyword_watcher._generate_suggested_actions(message) == original_actions(
+            content, has_media
+        ), content
+
+
+# --- check_for_updates against a fake async Playwright page ---
+
+class FakeChat:
+    def __init__(self, name, unread, messages):
+        self.name = name
+        self.unread = unread
+        self.messages = messages
+        self.page = None
+        self.clicked = False
+        self.disposed = False
+
+    async def click(self):
+        self.clicked = True
+        self.page.open_chat = self
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class FakePage:
+    """Answers the selectors check_for_updates uses, from a list of FakeChats."""
+
+    def __init__(self, chats):
+        self.chats = chats
+        self.open_chat = None
+        for chat in chats:
+            chat.page = self
+
+    def _details(self):
+        return [
+            {'name': chat.name, 'unread': chat.unread} if chat.unread else None
+            for chat in self.chats
+        ]
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return object()
+
+    async def eval_on_selector_all(self, selector, script, arg):
+        if selector == WhatsAppWatcher.SELECTORS['chat_item']:
+            return self._details()
+        if selector == WhatsAppWatcher.SELECTORS['message_in']:
+            max_messages = arg[0]
+            return self.open_chat.messages[-max_messages:]
+        raise AssertionError(f"unexpected selector {selector}")
+
+    async def query_selector_all(self, selector):
+        return list(self.chats)
+
+    async def evaluate(self, script, arg):
+        return self._details()
+
+
+def fake_message(content, sender=None, timestamp='09:30', has_media=False):
+    return {'content': content, 'sender': sender, 'timestamp': timestamp, 'has_media': has_media}
+
+
+def run_check(watcher, page):
+    async def check():
+        # Created inside the loop, as the watcher does on its loop thread
+        watcher._stop_event = asyncio.Event()
+        return await watcher.check_for_updates()
+
+    watcher.page = page
+    watcher.is_authenticated = True
+    return asyncio.run(check())
+
+
+def test_check_for_updates_reads_unread_chats(watcher):
+    alice = FakeChat('Alice', '2', [
+        fake_message('old message'),
+        fake_message('URGENT: invoice overdue'),
+        fake_message('see you tomorrow'),
+    ])
+    quiet = FakeChat('Quiet', None, [fake_message('ignored')])
+    team = FakeChat('Team', '7', [
+        fake_message('project contract ready', sender='Carol', has_media=True),
+    ])
+    page = FakePage([alice, quiet, team])
+    watcher._ws_frames = 1
+
+    messages = run_check(watcher, page)
+
+    assert [(m.sender, m.content) for m in messages] == [
+        ('Alice', 'URGENT: invoice overdue'),
+        ('Alice', 'see you tomorrow'),
+        ('Carol', 'project contract ready'),
+    ]
+    assert [m.priority for m in messages] == ['high', 'low', 'medium']
+    assert messages[2].is_group and messages[2].group_name == 'Team' and messages[2].has_media
+    assert not messages[0].is_group
+    assert alice.clicked and team.clicked and not quiet.clicked
+    assert all(chat.disposed for chat in page.chats)
+
+    # IDs are stable, and already-processed messages are skipped
+    for message in messages:
+        watcher._remember_id(message.message_id)
+    watcher._ws_frames += 1
+    assert run_check(watcher, page) == []
+
+
+def test_check_for_updates_skips_scan_without_socket_traffic(watcher):
+    page = FakePage([FakeChat('Alice', '1', [fake_message('urgent asap')])])
+    watcher._ws_frames = 3
+    assert len(run_check(watcher, page)) == 1
+
+    # No WebSocket frames since the last scan: the page is not touched
+    page.chats = None
+    assert run_check(watcher, page) == []
+
+
+def test_check_for_updates_requires_authentication(watcher):
+    watcher.is_authenticated = False
+    assert asyncio.run(watcher.check_for_updates()) == []
@@ -35,6 +35,9 @@ except ImportError:
     def is_mcp_active(server=None): return False
     def get_mcp_status_summary(): return {"any_active": False, "servers": {}}
 
+# Shared JSONL tail reader (reads backwards from the end of the file)
+from skills.jsonl_log import read_jsonl_tail
+
 # Import WhatsApp skill for real status
 try:
     from skills.whatsapp_skill import is_whatsapp_active, get_whatsapp_status
@@ -71,27 +74,33 @@ def terminal_log(action: str, details: str = ""):
     print(msg, flush=True)
 
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_HTML_ENTITY_RE = re.compile(r'&(nbsp|amp|lt|gt|quot|#\d+);')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_ENTITIES = {'nbsp': ' ', 'amp': '&', 'lt': '<', 'gt': '>', 'quot': '"'}
+
+
+def _replace_html_entity(match) -> str:
+    # Numeric entities (&#123;) are dropped, matching the named-entity cleanup
+    return _HTML_ENTITIES.get(match.group(1), '')
+
+
 def strip_html_tags(text: str) -> str:
     """Remove all HTML tags from text using regex - Complete cleanup for demo."""
     if not text:
         return ""
     # Remove all HTML tags including <div>, </div>, <span>, <p>, etc.
-    clean = re.sub(r'<[^>]+>', '', text)
-    # Remove HTML entities
-    clean = re.sub(r'&nbsp;', ' ', clean)
-    clean = re.sub(r'&amp;', '&', clean)
-    clean = re.sub(r'&lt;', '<', clean)
-    clean = re.sub(r'&gt;', '>', clean)
-    clean = re.sub(r'&quot;', '"', clean)
-    clean = re.sub(r'&#\d+;', '', clean)
+    clean = _HTML_TAG_RE.sub('', text)
+    # Decode HTML entities in one pass
+    clean = _HTML_ENTITY_RE.sub(_replace_html_entity, clean)
     # Remove extra whitespace and newlines
-    clean = re.sub(r'\s+', ' ', clean).strip()
-    return clean
+    return _WHITESPACE_RE.sub(' ', clean).strip()
 
 
+@st.cache_data(ttl=5)
 def get_mcp_server_status(server_name: str) -> tuple:
     """
-    Get MCP server status.
+    Get MCP server status. Cached for 5 seconds so reruns don't re-probe MCP.
 
     Returns:
         Tuple of (is_active: bool, status_text: str, icon: str)
@@ -113,42 +122,44 @@ def get_mcp_server_status(server_name: str) -> tuple:
         return (False, "MCP Offline", "🔴")
 
 
+@st.cache_data(ttl=30)
+def _load_mcp_config_cached(mtime_ns: int) -> dict:
+    try:
+        with open("mcp_config.json", encoding='utf-8') as f:
+            return json.load(f)
+    except:
+        return {}
+
+
 def load_mcp_config() -> dict:
-    """Load MCP configuration file."""
-    mcp_path = Path("mcp_config.json")
-    if mcp_path.exists():
-        try:
-            with open(mcp_path, encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    """Load MCP configuration file, re-parsing it only when its mtime changes."""
+    try:
+        mtime_ns = Path("mcp_config.json").stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_mcp_config_cached(mtime_ns)
+
+
+@st.cache_data(ttl=30)
+def _load_social_execution_log_cached(mtime_ns: int, limit: int) -> List[Dict]:
+    return read_jsonl_tail(Path("logs/social_execution.jsonl"), limit)
 
 
 def load_social_execution_log(limit: int = 10) -> List[Dict]:
     """Load social media execution log for Done column display."""
-    log_path = Path("logs/social_execution.json")
-    if not log_path.exists():
-        return []
     try:
-        with open(log_path, encoding='utf-8') as f:
-            logs = json.load(f)
-        return logs[-limit:]
-    except:
+        mtime_ns = Path("logs/social_execution.jsonl").stat().st_mtime_ns
+    except OSError:
         return []
+    return _load_social_execution_log_cached(mtime_ns, limit)
 
 
+@st.cache_data(ttl=5)
 def get_social_platform_status() -> Dict[str, Dict]:
     """Get MCP status for all social platforms (LinkedIn, Twitter, Instagram, Facebook)."""
-    mcp_config = load_mcp_config()
-    social_config = mcp_config.get("mcpServers", {}).get("social", {})
-    platforms_config = social_config.get("platforms", {})
-
     # In mock mode, all platforms are active
-    if is_mock_mode():
-        social_mcp_active = True
-    else:
-        social_mcp_active = is_mcp_active("social") if MCP_AVAILABLE else False
+    mock = is_mock_mode()
+    social_mcp_active = mock or (MCP_AVAILABLE and is_mcp_active("social"))
 
     platforms = {
         "linkedin": {"name": "LinkedIn", "icon": "💼", "color": "#0A66C2"},
@@ -157,18 +168,13 @@ def get_social_platform_status() -> Dict[str, Dict]:
         "facebook": {"name": "Facebook", "icon": "👥", "color": "#1877F2"}
     }
 
-    status_text = "🟢 Demo Active" if is_mock_mode() else ("🟢 MCP Active" if social_mcp_active else "🔴 MCP Offline")
-
-    result = {}
-    for key, platform in platforms.items():
-        result[key] = {
-            **platform,
-            "mcp_active": social_mcp_active,
-            "status": status_text,
-            "dot_class": "conn-dot-green" if social_mcp_active else "conn-dot-red"
-        }
+    status_text = "🟢 Demo Active" if mock else ("🟢 MCP Active" if social_mcp_active else "🔴 MCP Offline")
+    dot_class = "conn-dot-green" if social_mcp_active else "conn-dot-red"
 
-    return result
+    return {
+        key: {**platform, "mcp_active": social_mcp_active, "status": status_text, "dot_class": dot_class}
+        for key, platform in platforms.items()
+    }
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -187,13 +193,21 @@ PENDING_ODOO_PATH = VAULT_PATH / "Pending_Approval" / "odoo"
 DONE_PATH = VAULT_PATH / "Done"
 LOGS_PATH = Path("logs")
 AUDIT_LOG_PATH = LOGS_PATH / "audit_log.json"
+SOCIAL_AUDIT_LOG_PATH = LOGS_PATH / "audit_log.jsonl"
 CREDENTIALS_PATH = Path("credentials")
 WORKSPACE_PATH = Path("workspace")
 
+
+@st.cache_resource
+def _ensure_dirs():
+    """Create the vault directories once per process rather than on every rerun."""
+    for path in [INBOX_PATH, NEEDS_ACTION_PATH, PLANS_PATH, APPROVED_PATH,
+                 APPROVED_ODOO_PATH, PENDING_ODOO_PATH, DONE_PATH, LOGS_PATH, WORKSPACE_PATH]:
+        path.mkdir(parents=True, exist_ok=True)
+
+
 # Ensure directories exist
-for path in [INBOX_PATH, NEEDS_ACTION_PATH, PLANS_PATH, APPROVED_PATH,
-             APPROVED_ODOO_PATH, PENDING_ODOO_PATH, DONE_PATH, LOGS_PATH, WORKSPACE_PATH]:
-    path.mkdir(parents=True, exist_ok=True)
+_ensure_dirs()
 
 
 # =============================================================================
@@ -229,24 +243,57 @@ MOCK_FINANCIAL_DATA = [
 ]
 
 
+@st.cache_data
+def get_mock_whatsapp_feed_html(limit: int) -> str:
+    """Render the mock WhatsApp feed once; the messages never change between reruns."""
+    wa_html = '<div class="wa-feed">'
+    for msg in MOCK_WHATSAPP[:limit]:
+        # Clean message text by stripping any HTML tags
+        clean_from = strip_html_tags(msg["from"])
+        clean_msg = strip_html_tags(msg["msg"])
+        clean_time = strip_html_tags(msg["time"])
+        wa_html += f'''
+        <div class="wa-msg">
+            <div class="wa-from">{clean_from}</div>
+            <div class="wa-text">{clean_msg}</div>
+            <div class="wa-time">{clean_time}</div>
+        </div>
+        '''
+    wa_html += '</div>'
+    return wa_html
+
+
+@st.cache_resource
+def get_mock_financial_df() -> pd.DataFrame:
+    """Build the Financial Audit frame once; shared, so callers must not mutate it."""
+    return pd.DataFrame(MOCK_FINANCIAL_DATA)
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def load_env() -> Dict[str, str]:
-    """Load .env file."""
+@st.cache_data
+def _load_env_cached(mtime_ns: int) -> Dict[str, str]:
     env = {}
-    env_path = Path('.env')
-    if env_path.exists():
-        with open(env_path, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    k, v = line.split('=', 1)
-                    env[k.strip()] = v.strip()
+    with open('.env', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and line[0] != '#' and '=' in line:
+                k, v = line.split('=', 1)
+                env[k.strip()] = v.strip()
     return env
 
 
+def load_env() -> Dict[str, str]:
+    """Load .env file, re-parsing it only when its mtime changes."""
+    try:
+        mtime_ns = Path('.env').stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_env_cached(mtime_ns)
+
+
 def is_mock_mode() -> bool:
     """Check if running in mock mode."""
     env = load_env()
@@ -307,16 +354,28 @@ def get_type_icon(t: str) -> str:
             'pdf': '📕', 'csv': '📊', 'markdown': '📝'}.get(t, '📄')
 
 
-def load_audit_log(limit: int = 50) -> List[Dict]:
-    """Load audit log entries."""
-    if not AUDIT_LOG_PATH.exists():
-        return []
-    try:
-        with open(AUDIT_LOG_PATH, encoding='utf-8') as f:
-            logs = json.load(f)
-            return logs[-limit:] if isinstance(logs, list) else []
-    except:
-        return []
+def load_audit_log(limit: int = 50, include_social: bool = True) -> List[Dict]:
+    """
+    Load audit log entries.
+
+    With include_social, entries from the social media JSONL audit log are
+    merged in by timestamp.
+    """
+    logs = []
+    if AUDIT_LOG_PATH.exists():
+        try:
+            with open(AUDIT_LOG_PATH, encoding='utf-8') as f:
+                logs = json.load(f)
+                logs = logs[-limit:] if isinstance(logs, list) else []
+        except:
+            logs = []
+
+    if include_social:
+        social_logs = read_jsonl_tail(SOCIAL_AUDIT_LOG_PATH, limit)
+        if social_logs:
+            logs = sorted(logs + social_logs, key=lambda e: e.get('timestamp', ''))[-limit:]
+
+    return logs
 
 
 def add_log(action: str, status: str, details: dict):
@@ -328,7 +387,7 @@ def add_log(action: str, status: str, details: dict):
         "status": status,
         "details": details
     }
-    logs = load_audit_log(100)
+    logs = load_audit_log(100, include_social=False)
     logs.append(entry)
     with open(AUDIT_LOG_PATH, 'w', encoding='utf-8') as f:
         json.dump(logs[-100:], f, indent=2)
@@ -988,21 +1047,7 @@ with st.sidebar:
 
     # WhatsApp Feed - Strip HTML tags for clean display
     st.markdown("**Recent Messages:**")
-    wa_html = '<div class="wa-feed">'
-    for msg in MOCK_WHATSAPP[:4]:
-        # Clean message text by stripping any HTML tags
-        clean_from = strip_html_tags(msg["from"])
-        clean_msg = strip_html_tags(msg["msg"])
-        clean_time = strip_html_tags(msg["time"])
-        wa_html += f'''
-        <div class="wa-msg">
-            <div class="wa-from">{clean_from}</div>
-            <div class="wa-text">{clean_msg}</div>
-            <div class="wa-time">{clean_time}</div>
-        </div>
-        '''
-    wa_html += '</div>'
-    st.markdown(wa_html, unsafe_allow_html=True)
+    st.markdown(get_mock_whatsapp_feed_html(4), unsafe_allow_html=True)
     terminal_log("WHATSAPP_FEED", f"Displayed {len(MOCK_WHATSAPP[:4])} messages (HTML stripped)")
 
     st.markdown("")  # Spacer
@@ -1578,7 +1623,7 @@ with tab2:
     st.markdown("*Subscription tracking and cost analysis from financial_audit.csv*")
 
     # Create DataFrame
-    df = pd.DataFrame(MOCK_FINANCIAL_DATA)
+    df = get_mock_financial_df()
 
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)